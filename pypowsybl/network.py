@@ -214,7 +214,7 @@ class Network:  # pylint: disable=too-many-public-methods
 
     def __setstate__(self, state: _Dict[str, str]) -> None:
         xml = state['xml']
-        self._handle = _pp.load_network_from_string('tmp.xiidm', xml, {})
+        Network.__init__(self, _pp.load_network_from_string('tmp.xiidm', xml, {}))
 
     def open_switch(self, id: str) -> bool:
         return _pp.update_switch_position(self._handle, id, True)
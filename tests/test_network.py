@@ -4,7 +4,10 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 #
+import contextlib
 import copy
+import functools
+import os
 import unittest
 import datetime
 import pandas as pd
@@ -13,18 +16,587 @@ import numpy as np
 
 import pypowsybl as pp
 import pathlib
-import matplotlib.pyplot as plt
-import networkx as nx
 import util
 import tempfile
 
 
 TEST_DIR = pathlib.Path(__file__).parent
 DATA_DIR = TEST_DIR.parent.joinpath('data')
+_BATTERY_XML = TEST_DIR.joinpath('battery.xiidm').read_text()
+
+_EXPECTED_BUSES_INITIAL = pd.DataFrame(index=pd.Index(['VLGEN_0', 'VLHV1_0', 'VLHV2_0', 'VLLOAD_0'], name='id'),
+                                       data={'name': ['', '', '', ''],
+                                             'v_mag': [NaN, 380.0, 380.0, NaN],
+                                             'v_angle': [NaN, NaN, NaN, NaN],
+                                             'connected_component': np.array([0, 0, 0, 0], dtype=np.int32),
+                                             'synchronous_component': np.array([0, 0, 0, 0], dtype=np.int32),
+                                             'voltage_level_id': ['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD']})
+
+_EXPECTED_BUSES_UPDATED = pd.DataFrame(index=pd.Index(['VLGEN_0', 'VLHV1_0', 'VLHV2_0', 'VLLOAD_0'], name='id'),
+                                       data={'name': ['', '', '', ''],
+                                             'v_mag': [400.0, 380.0, 380.0, NaN],
+                                             'v_angle': [0.0, NaN, NaN, NaN],
+                                             'connected_component': np.array([0, 0, 0, 0], dtype=np.int32),
+                                             'synchronous_component': np.array([0, 0, 0, 0], dtype=np.int32),
+                                             'voltage_level_id': ['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD']})
+
+_EXPECTED_LCC_INITIAL = pd.DataFrame(index=pd.Index(['LCC1', 'LCC2'], name='id'),
+                                     data={'name': ['LCC1', 'LCC2'],
+                                           'power_factor': [0.6, 0.6],
+                                           'loss_factor': [1.1, 1.1],
+                                           'p': [80.88, -79.12],
+                                           'q': [NaN, NaN],
+                                           'i': [NaN, NaN],
+                                           'voltage_level_id': ['S1VL2', 'S3VL1'],
+                                           'bus_id': ['S1VL2_0', 'S3VL1_0'],
+                                           'connected': [True, True]})
+
+_EXPECTED_LCC_UPDATED = pd.DataFrame(index=pd.Index(['LCC1', 'LCC2'], name='id'),
+                                     data={'name': ['LCC1', 'LCC2'],
+                                           'power_factor': [0.7, 0.6],
+                                           'loss_factor': [1.2, 1.1],
+                                           'p': [82.0, -79.12],
+                                           'q': [69.0, NaN],
+                                           'i': [154.68, NaN],
+                                           'voltage_level_id': ['S1VL2', 'S3VL1'],
+                                           'bus_id': ['S1VL2_0', 'S3VL1_0'],
+                                           'connected': [True, True]})
+
+_EXPECTED_SVC_INITIAL = pd.DataFrame(index=pd.Index(['SVC'], name='id'),
+                                     data={'name': [''],
+                                           'b_min': [-0.05],
+                                           'b_max': [0.05],
+                                           'target_v': [400.0],
+                                           'target_q': [NaN],
+                                           'regulation_mode': ['VOLTAGE'],
+                                           'p': [NaN],
+                                           'q': [-12.54],
+                                           'i': [NaN],
+                                           'voltage_level_id': ['S4VL1'],
+                                           'bus_id': ['S4VL1_0'],
+                                           'connected': [True]})
+
+_EXPECTED_SVC_UPDATED = pd.DataFrame(index=pd.Index(['SVC'], name='id'),
+                                     data={'name': [''],
+                                           'b_min': [-0.06],
+                                           'b_max': [0.06],
+                                           'target_v': [398.0],
+                                           'target_q': [100.0],
+                                           'regulation_mode': ['REACTIVE_POWER'],
+                                           'p': [-12.0],
+                                           'q': [-13.0],
+                                           'i': [25.54],
+                                           'voltage_level_id': ['S4VL1'],
+                                           'bus_id': ['S4VL1_0'],
+                                           'connected': [True]})
+
+_EXPECTED_2WT_INITIAL = pd.DataFrame(index=pd.Index(['NGEN_NHV1', 'NHV2_NLOAD'], name='id'),
+                                     data={'name': ['', ''],
+                                           'r': [0.27, 0.05],
+                                           'x': [11.10, 4.05],
+                                           'g': [0.0, 0.0],
+                                           'b': [0.0, 0.0],
+                                           'rated_u1': [24.0, 400.0],
+                                           'rated_u2': [400.0, 158.0],
+                                           'rated_s': [NaN, NaN],
+                                           'p1': [NaN, NaN],
+                                           'q1': [NaN, NaN],
+                                           'i1': [NaN, NaN],
+                                           'p2': [NaN, NaN],
+                                           'q2': [NaN, NaN],
+                                           'i2': [NaN, NaN],
+                                           'voltage_level1_id': ['VLGEN', 'VLHV2'],
+                                           'voltage_level2_id': ['VLHV1', 'VLLOAD'],
+                                           'bus1_id': ['VLGEN_0', 'VLHV2_0'],
+                                           'bus2_id': ['VLHV1_0', 'VLLOAD_0'],
+                                           'connected1': [True, True],
+                                           'connected2': [True, True]})
+
+_EXPECTED_2WT_UPDATED = pd.DataFrame(index=pd.Index(['NGEN_NHV1', 'NHV2_NLOAD'], name='id'),
+                                     data={'name': ['', ''],
+                                           'r': [0.3, 0.047],
+                                           'x': [11.2, 4.05],
+                                           'g': [1.0, 0.0],
+                                           'b': [1.0, 0.0],
+                                           'rated_u1': [90.0, 400.0],
+                                           'rated_u2': [225.0, 158.0],
+                                           'rated_s': [NaN, NaN],
+                                           'p1': [NaN, NaN],
+                                           'q1': [NaN, NaN],
+                                           'i1': [NaN, NaN],
+                                           'p2': [NaN, NaN],
+                                           'q2': [NaN, NaN],
+                                           'i2': [NaN, NaN],
+                                           'voltage_level1_id': ['VLGEN', 'VLHV2'],
+                                           'voltage_level2_id': ['VLHV1', 'VLLOAD'],
+                                           'bus1_id': ['', 'VLHV2_0'],
+                                           'bus2_id': ['', 'VLLOAD_0'],
+                                           'connected1': [False, True],
+                                           'connected2': [False, True]})
+
+_EXPECTED_SUBSTATIONS_INITIAL = pd.DataFrame(index=pd.Index(['P1', 'P2'], name='id'),
+                                             data={'name': ['', ''],
+                                                   'TSO': ['RTE', 'RTE'],
+                                                   'geo_tags': ['A', 'B'],
+                                                   'country': ['FR', 'BE']})
+
+_EXPECTED_SUBSTATIONS_UPDATED = pd.DataFrame(index=pd.Index(['P1', 'P2'], name='id'),
+                                             data={'name': ['', ''],
+                                                   'TSO': ['RTE', 'REE'],
+                                                   'geo_tags': ['A', 'B'],
+                                                   'country': ['FR', 'ES']})
+
+_EXPECTED_RATIO_TAP_CHANGERS_INITIAL = pd.DataFrame(index=pd.Index(['NHV2_NLOAD'], name='id'),
+                                                    data={'tap': np.array([1], dtype=np.int32),
+                                                          'low_tap': np.array([0], dtype=np.int32),
+                                                          'high_tap': np.array([2], dtype=np.int32),
+                                                          'step_count': np.array([3], dtype=np.int32),
+                                                          'on_load': [True],
+                                                          'regulating': [True],
+                                                          'target_v': [158.0],
+                                                          'target_deadband': [0.0],
+                                                          'regulating_bus_id': ['VLLOAD_0'],
+                                                          'rho': [0.4],
+                                                          'alpha': [NaN]})
+
+_EXPECTED_RATIO_TAP_CHANGERS_UPDATED = pd.DataFrame(index=pd.Index(['NHV2_NLOAD'], name='id'),
+                                                    data={'tap': np.array([0], dtype=np.int32),
+                                                          'low_tap': np.array([0], dtype=np.int32),
+                                                          'high_tap': np.array([2], dtype=np.int32),
+                                                          'step_count': np.array([3], dtype=np.int32),
+                                                          'on_load': [True],
+                                                          'regulating': [False],
+                                                          'target_v': [180.0],
+                                                          'target_deadband': [0.0],
+                                                          'regulating_bus_id': ['VLLOAD_0'],
+                                                          'rho': [0.34],
+                                                          'alpha': [NaN]})
+
+_EXPECTED_LINES_INITIAL = pd.DataFrame(index=pd.Index(['LINE_S2S3', 'LINE_S3S4'], name='id'),
+                                       data={'name': ['', ''],
+                                             'r': [0.01, 0.01],
+                                             'x': [19.1, 13.1],
+                                             'g1': [0.0, 0.0],
+                                             'b1': [0.0, 0.0],
+                                             'g2': [0.0, 0.0],
+                                             'b2': [0.0, 0.0],
+                                             'p1': [109.889, 240.004],
+                                             'q1': [190.023, 2.1751],
+                                             'i1': [309.979, 346.43],
+                                             'p2': [-109.886, -240.0],
+                                             'q2': [-184.517, 2.5415],
+                                             'i2': [309.978, 346.43],
+                                             'voltage_level1_id': ['S2VL1', 'S3VL1'],
+                                             'voltage_level2_id': ['S3VL1', 'S4VL1'],
+                                             'bus1_id': ['S2VL1_0', 'S3VL1_0'],
+                                             'bus2_id': ['S3VL1_0', 'S4VL1_0'],
+                                             'connected1': [True, True],
+                                             'connected2': [True, True]})
+
+_EXPECTED_LINES_UPDATED = pd.DataFrame(index=pd.Index(['LINE_S2S3'], name='id'),
+                                       data={'name': [''],
+                                             'r': [1.0],
+                                             'x': [2.0],
+                                             'g1': [3.0],
+                                             'b1': [4.0],
+                                             'g2': [5.0],
+                                             'b2': [6.0],
+                                             'p1': [7.0],
+                                             'q1': [8.0],
+                                             'i1': [15.011282],
+                                             'p2': [9.0],
+                                             'q2': [10.0],
+                                             'i2': [19.418634],
+                                             'voltage_level1_id': ['S2VL1'],
+                                             'voltage_level2_id': ['S3VL1'],
+                                             'bus1_id': ['S2VL1_0'],
+                                             'bus2_id': ['S3VL1_0'],
+                                             'connected1': [True],
+                                             'connected2': [True]})
+
+_EXPECTED_DANGLING_LINES_INITIAL = pd.DataFrame(index=pd.Index(['DL'], name='id'),
+                                                data={'name': [''],
+                                                      'r': [10.0],
+                                                      'x': [1.0],
+                                                      'g': [0.0001],
+                                                      'b': [0.00001],
+                                                      'p0': [50.0],
+                                                      'q0': [30.0],
+                                                      'p': [NaN],
+                                                      'q': [NaN],
+                                                      'i': [NaN],
+                                                      'voltage_level_id': ['VL'],
+                                                      'bus_id': ['VL_0'],
+                                                      'connected': [True],
+                                                      'ucte-x-node-code': ['']})
+
+_EXPECTED_DANGLING_LINES_UPDATED = pd.DataFrame(index=pd.Index(['DL'], name='id'),
+                                                data={'name': [''],
+                                                      'r': [11.0],
+                                                      'x': [1.1],
+                                                      'g': [0.0002],
+                                                      'b': [0.00002],
+                                                      'p0': [40.0],
+                                                      'q0': [40.0],
+                                                      'p': [NaN],
+                                                      'q': [NaN],
+                                                      'i': [NaN],
+                                                      'voltage_level_id': ['VL'],
+                                                      'bus_id': [''],
+                                                      'connected': [False],
+                                                      'ucte-x-node-code': ['']})
+
+_EXPECTED_BATTERIES_INITIAL = pd.DataFrame(index=pd.Index(['BAT', 'BAT2'], name='id'),
+                                           data={'name': ['', ''],
+                                                 'max_p': [9999.99, 200.0],
+                                                 'min_p': [-9999.99, -200.0],
+                                                 'p0': [9999.99, 100.0],
+                                                 'q0': [9999.99, 200.0],
+                                                 'p': [-605.0, -605.0],
+                                                 'q': [-225.0, -225.0],
+                                                 'i': [NaN, NaN],
+                                                 'voltage_level_id': ['VLBAT', 'VLBAT'],
+                                                 'bus_id': ['VLBAT_0', 'VLBAT_0'],
+                                                 'connected': [True, True]})
+
+_EXPECTED_BATTERIES_UPDATED = pd.DataFrame(index=pd.Index(['BAT2'], name='id'),
+                                           data={'name': [''],
+                                                 'max_p': [200.0],
+                                                 'min_p': [-200.0],
+                                                 'p0': [50.0],
+                                                 'q0': [100.0],
+                                                 'p': [-605.0],
+                                                 'q': [-225.0],
+                                                 'i': [NaN],
+                                                 'voltage_level_id': ['VLBAT'],
+                                                 'bus_id': ['VLBAT_0'],
+                                                 'connected': [True]})
+
+_EXPECTED_SHUNT_INITIAL = pd.DataFrame(index=pd.Index(['SHUNT'], name='id'),
+                                       data={'name': [''],
+                                             'g': [0.0],
+                                             'b': [-0.012],
+                                             'model_type': ['LINEAR'],
+                                             'max_section_count': np.array([1], dtype=np.int32),
+                                             'section_count': np.array([1], dtype=np.int32),
+                                             'voltage_regulation_on': [False],
+                                             'target_v': [NaN],
+                                             'target_deadband': [NaN],
+                                             'regulating_bus_id': ['S1VL2_0'],
+                                             'p': [NaN],
+                                             'q': [1920.0],
+                                             'i': [NaN],
+                                             'voltage_level_id': ['S1VL2'],
+                                             'bus_id': ['S1VL2_0'],
+                                             'connected': [True]})
+
+_EXPECTED_SHUNT_UPDATED = pd.DataFrame(index=pd.Index(['SHUNT'], name='id'),
+                                       data={'name': [''],
+                                             'g': [0.0],
+                                             'b': [-0.0],
+                                             'model_type': ['LINEAR'],
+                                             'max_section_count': np.array([1], dtype=np.int32),
+                                             'section_count': np.array([0], dtype=np.int32),
+                                             'voltage_regulation_on': [True],
+                                             'target_v': [50.0],
+                                             'target_deadband': [3.0],
+                                             'regulating_bus_id': [''],
+                                             'p': [NaN],
+                                             'q': [1900.0],
+                                             'i': [NaN],
+                                             'voltage_level_id': ['S1VL2'],
+                                             'bus_id': [''],
+                                             'connected': [False]})
+
+_EXPECTED_3WT = pd.DataFrame(index=pd.Index(['3WT'], name='id'),
+                             data={'name': [''],
+                                   'rated_u0': [132.0],
+                                   'r1': [17.424],
+                                   'x1': [1.7424],
+                                   'g1': [0.00573921],
+                                   'b1': [0.000573921],
+                                   'rated_u1': [132.0],
+                                   'rated_s1': [NaN],
+                                   'ratio_tap_position1': np.array([-99999], dtype=np.int32),
+                                   'phase_tap_position1': np.array([-99999], dtype=np.int32),
+                                   'p1': [NaN],
+                                   'q1': [NaN],
+                                   'i1': [NaN],
+                                   'voltage_level1_id': ['VL_132'],
+                                   'bus1_id': ['VL_132_0'],
+                                   'connected1': [True],
+                                   'r2': [1.089],
+                                   'x2': [0.1089],
+                                   'g2': [0.0],
+                                   'b2': [0.0],
+                                   'rated_u2': [33.0],
+                                   'rated_s2': [NaN],
+                                   'ratio_tap_position2': np.array([2], dtype=np.int32),
+                                   'phase_tap_position2': np.array([-99999], dtype=np.int32),
+                                   'p2': [NaN],
+                                   'q2': [NaN],
+                                   'i2': [NaN],
+                                   'voltage_level2_id': ['VL_33'],
+                                   'bus2_id': ['VL_33_0'],
+                                   'connected2': [True],
+                                   'r3': [0.121],
+                                   'x3': [0.0121],
+                                   'g3': [0.0],
+                                   'b3': [0.0],
+                                   'rated_u3': [11.0],
+                                   'rated_s3': [NaN],
+                                   'ratio_tap_position3': np.array([0], dtype=np.int32),
+                                   'phase_tap_position3': np.array([-99999], dtype=np.int32),
+                                   'p3': [NaN],
+                                   'q3': [NaN],
+                                   'i3': [NaN],
+                                   'voltage_level3_id': ['VL_11'],
+                                   'bus3_id': ['VL_11_0'],
+                                   'connected3': [True]})
+
+_EXPECTED_BUSBAR_SECTIONS_INITIAL = pd.DataFrame(index=pd.Index(['S1VL1_BBS', 'S1VL2_BBS1', 'S1VL2_BBS2', 'S2VL1_BBS',
+                                                                 'S3VL1_BBS', 'S4VL1_BBS'], name='id'),
+                                                 data={'name': ['S1VL1_BBS', 'S1VL2_BBS1', 'S1VL2_BBS2', 'S2VL1_BBS',
+                                                                'S3VL1_BBS', 'S4VL1_BBS'],
+                                                       'fictitious': [False, False, False, False, False, False],
+                                                       'v': [224.6139, 400.0000, 400.0000, 408.8470, 400.0000,
+                                                             400.0000],
+                                                       'angle': [2.2822, 0.0000, 0.0000, 0.7347, 0.0000, -1.1259],
+                                                       'voltage_level_id': ['S1VL1', 'S1VL2', 'S1VL2', 'S2VL1',
+                                                                            'S3VL1', 'S4VL1'],
+                                                       'connected': [True, True, True, True, True, True]})
+
+_EXPECTED_BUSBAR_SECTIONS_UPDATED = pd.DataFrame(index=pd.Index(['S1VL1_BBS'], name='id'),
+                                                 data={'name': ['S1VL1_BBS'],
+                                                       'fictitious': [True],
+                                                       'v': [224.6139],
+                                                       'angle': [2.2822],
+                                                       'voltage_level_id': ['S1VL1'],
+                                                       'connected': [True]})
+
+_MI_CURRENT_LIMIT = pd.MultiIndex.from_tuples([('NHV1_NHV2_1', '10\'')], names=['branch_id', 'name'])
+_MI_NONLINEAR_SHUNT = pd.MultiIndex.from_tuples([('SHUNT', 0), ('SHUNT', 1)], names=['id', 'section'])
+
+_EXPECTED_NON_LINEAR_SHUNT_SECTIONS_INITIAL = pd.DataFrame(index=_MI_NONLINEAR_SHUNT,
+                                                           data={'g': [0.0, 0.3],
+                                                                 'b': [0.00001, 0.02000]})
+
+_EXPECTED_NON_LINEAR_SHUNT_SECTIONS_UPDATED = pd.DataFrame(index=_MI_NONLINEAR_SHUNT,
+                                                           data={'g': [0.1, 0.4],
+                                                                 'b': [0.00002, 0.03]})
+
+_EXPECTED_VOLTAGE_LEVELS_INITIAL = pd.DataFrame(index=pd.Index(['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD'], name='id'),
+                                                data={'name': ['', '', '', ''],
+                                                      'substation_id': ['P1', 'P1', 'P2', 'P2'],
+                                                      'nominal_v': [24.0, 380.0, 380.0, 150.0],
+                                                      'high_voltage_limit': [NaN, 500.0, 500.0, NaN],
+                                                      'low_voltage_limit': [NaN, 400.0, 300.0, NaN]})
+
+_EXPECTED_VOLTAGE_LEVELS_UPDATED = pd.DataFrame(index=pd.Index(['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD'], name='id'),
+                                                data={'name': ['', '', '', ''],
+                                                      'substation_id': ['P1', 'P1', 'P2', 'P2'],
+                                                      'nominal_v': [25.0, 380.0, 380.0, 151.0],
+                                                      'high_voltage_limit': [50.0, 500.0, 500.0, 175.0],
+                                                      'low_voltage_limit': [20.0, 400.0, 300.0, 125.0]})
+
+_EXPECTED_LINEAR_SHUNT_SECTIONS_INITIAL = pd.DataFrame(index=pd.Index(['SHUNT'], name='id'),
+                                                       data={'g_per_section': [NaN],
+                                                             'b_per_section': [-0.012],
+                                                             'max_section_count': np.array([1], dtype=np.int32)})
+
+_EXPECTED_LINEAR_SHUNT_SECTIONS_UPDATED = pd.DataFrame(index=pd.Index(['SHUNT'], name='id'),
+                                                       data={'g_per_section': [0.14],
+                                                             'b_per_section': [-0.01],
+                                                             'max_section_count': np.array([4], dtype=np.int32)})
+
+_EXPECTED_BUS_BREAKER_VIEW_SWITCHES = pd.DataFrame(index=pd.Index(['S1VL2_TWT_BREAKER', 'S1VL2_VSC1_BREAKER',
+                                                                   'S1VL2_GH1_BREAKER', 'S1VL2_GH2_BREAKER',
+                                                                   'S1VL2_GH3_BREAKER', 'S1VL2_LD2_BREAKER',
+                                                                   'S1VL2_LD3_BREAKER', 'S1VL2_LD4_BREAKER',
+                                                                   'S1VL2_SHUNT_BREAKER', 'S1VL2_LCC1_BREAKER',
+                                                                   'S1VL2_COUPLER'], name='id'),
+                                                   data={'kind': np.full(11, 'BREAKER', dtype=object),
+                                                         'open': np.repeat([False, True], [10, 1]),
+                                                         'bus1_id': ['S1VL2_0', 'S1VL2_1', 'S1VL2_0', 'S1VL2_0',
+                                                                     'S1VL2_0', 'S1VL2_1', 'S1VL2_1', 'S1VL2_1',
+                                                                     'S1VL2_0', 'S1VL2_1', 'S1VL2_0'],
+                                                         'bus2_id': ['S1VL2_3', 'S1VL2_5', 'S1VL2_7', 'S1VL2_9',
+                                                                     'S1VL2_11', 'S1VL2_13', 'S1VL2_15', 'S1VL2_17',
+                                                                     'S1VL2_19', 'S1VL2_21', 'S1VL2_1']})
+
+_EXPECTED_BUS_BREAKER_VIEW_BUSES = pd.DataFrame(index=pd.Index(['S1VL2_0', 'S1VL2_1', 'S1VL2_3', 'S1VL2_5', 'S1VL2_7',
+                                                                'S1VL2_9', 'S1VL2_11', 'S1VL2_13', 'S1VL2_15',
+                                                                'S1VL2_17', 'S1VL2_19', 'S1VL2_21'], name='id'),
+                                                data={'name': np.full(12, '', dtype=object),
+                                                      'bus_id': ['S1VL2_0', 'S1VL2_1', 'S1VL2_0', 'S1VL2_1',
+                                                                 'S1VL2_0', 'S1VL2_0', 'S1VL2_0', 'S1VL2_1',
+                                                                 'S1VL2_1', 'S1VL2_1', 'S1VL2_0', 'S1VL2_1']})
+
+_EXPECTED_BUS_BREAKER_VIEW_ELEMENTS = pd.DataFrame(index=pd.Index(['S1VL2_BBS1', 'S1VL2_BBS2', 'TWT', 'VSC1', 'GH1',
+                                                                   'GH2', 'GH3', 'LD2', 'LD3', 'LD4', 'SHUNT',
+                                                                   'LCC1'], name='id'),
+                                                   data={'type': ['BUSBAR_SECTION', 'BUSBAR_SECTION',
+                                                                  'TWO_WINDINGS_TRANSFORMER',
+                                                                  'HVDC_CONVERTER_STATION', 'GENERATOR', 'GENERATOR',
+                                                                  'GENERATOR', 'LOAD', 'LOAD', 'LOAD',
+                                                                  'SHUNT_COMPENSATOR', 'HVDC_CONVERTER_STATION'],
+                                                         'bus_id': ['S1VL2_0', 'S1VL2_1', 'S1VL2_3', 'S1VL2_5',
+                                                                    'S1VL2_7', 'S1VL2_9', 'S1VL2_11', 'S1VL2_13',
+                                                                    'S1VL2_15', 'S1VL2_17', 'S1VL2_19', 'S1VL2_21'],
+                                                         'side': np.repeat(np.array(['', 'TWO', ''], dtype=object),
+                                                                           [2, 1, 9])})
+
+_EXPECTED_VLHV1_BUS_BREAKER_BUSES = pd.DataFrame(index=pd.Index(['NHV1'], name='id'),
+                                                 data={'name': [''],
+                                                       'bus_id': ['VLHV1_0']})
+
+_EXPECTED_VLHV1_DISCONNECTED_BUSES = pd.DataFrame(index=pd.Index(['NHV1'], name='id'),
+                                                  data={'name': [''],
+                                                        'bus_id': ['']})
+
+_EXPECTED_VLHV1_DISCONNECTED_LINE = pd.DataFrame(index=pd.Index(['NHV1_NHV2_1'], name='id'),
+                                                 data={'bus_id': ['']})
+
+_EXPECTED_S4VL1_LINES3S4_DISCONNECTOR = pd.DataFrame(index=pd.Index(['S4VL1_BBS_LINES3S4_DISCONNECTOR'], name='id'),
+                                                     data={'name': ['S4VL1_BBS_LINES3S4_DISCONNECTOR'],
+                                                           'kind': ['DISCONNECTOR'],
+                                                           'open': [False],
+                                                           'node1': np.array([0], dtype=np.int32),
+                                                           'node2': np.array([5], dtype=np.int32)})
+
+_EXPECTED_BUSES_SELECTED_ATTRIBUTES = pd.DataFrame(index=pd.Index(['VLGEN_0', 'VLHV1_0', 'VLHV2_0',
+                                                                   'VLLOAD_0'], name='id'),
+                                                   data={'v_mag': [NaN, 380.0, 380.0, NaN],
+                                                         'voltage_level_id': ['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD']})
+
+_EXPECTED_DL_LIMITS = pd.DataFrame(index=pd.Index(['DL', 'DL', 'DL'], name='element_id'),
+                                   data={'element_type': ['DANGLING_LINE', 'DANGLING_LINE', 'DANGLING_LINE'],
+                                         'side': ['NONE', 'NONE', 'NONE'],
+                                         'name': ['permanent_limit', '20\'', '10\''],
+                                         'type': ['CURRENT', 'CURRENT', 'CURRENT'],
+                                         'value': [100.0, 120.0, 140.0],
+                                         'acceptable_duration': np.array([-1, 1200, 600], dtype=np.int32),
+                                         'is_fictitious': [False, False, False]})
+
+_EXPECTED_NHV1_NHV2_1_PERMANENT_LIMITS = pd.DataFrame(index=pd.Index(['NHV1_NHV2_1', 'NHV1_NHV2_1', 'NHV1_NHV2_1',
+                                                                      'NHV1_NHV2_1'], name='element_id'),
+                                                      data={'element_type': ['LINE', 'LINE', 'LINE', 'LINE'],
+                                                            'side': ['ONE', 'TWO', 'ONE', 'TWO'],
+                                                            'name': ['permanent_limit', 'permanent_limit',
+                                                                     'permanent_limit', 'permanent_limit'],
+                                                            'type': ['ACTIVE_POWER', 'ACTIVE_POWER', 'APPARENT_POWER',
+                                                                     'APPARENT_POWER'],
+                                                            'value': [500.0, 1100.0, 500.0, 1100.0],
+                                                            'acceptable_duration': np.array([-1, -1, -1, -1],
+                                                                                            dtype=np.int32),
+                                                            'is_fictitious': [False, False, False, False]})
+
+_EXPECTED_NHV1_NHV2_2_20_LIMITS = pd.DataFrame(index=pd.Index(['NHV1_NHV2_2', 'NHV1_NHV2_2'], name='element_id'),
+                                               data={'element_type': ['LINE', 'LINE'],
+                                                     'side': ['ONE', 'ONE'],
+                                                     'name': ['20\'', '20\''],
+                                                     'type': ['ACTIVE_POWER', 'APPARENT_POWER'],
+                                                     'value': [1200.0, 1200.0],
+                                                     'acceptable_duration': np.array([1200, 1200], dtype=np.int32),
+                                                     'is_fictitious': [False, False]})
+
+_EXPECTED_3WT_10_LIMITS = pd.DataFrame(index=pd.Index(['3WT', '3WT', '3WT'], name='element_id'),
+                                       data={'element_type': ['THREE_WINDINGS_TRANSFORMER',
+                                                              'THREE_WINDINGS_TRANSFORMER',
+                                                              'THREE_WINDINGS_TRANSFORMER'],
+                                             'side': ['ONE', 'TWO', 'THREE'],
+                                             'name': ['10\'', '10\'', '10\''],
+                                             'type': ['CURRENT', 'CURRENT', 'CURRENT'],
+                                             'value': [1400.0, 140.0, 14.0],
+                                             'acceptable_duration': np.array([600, 600, 600], dtype=np.int32),
+                                             'is_fictitious': [False, False, False]})
+
+# (shared network, getter, id filters) checked against the matching rows of the unfiltered dataframe
+_ELEMENTS_FILTERING_CASES = [
+    ('four_substations', 'get_2_windings_transformers', {'id': 'TWT'}),
+    ('micro_grid_be', 'get_3_windings_transformers', {'id': ['_84ed55f4-61f5-4d9d-8755-bba7b877a246']}),
+    ('micro_grid_be', 'get_shunt_compensators', {'id': ['_002b0a40-3957-46db-b84a-30420083558f']}),
+    ('battery', 'get_batteries', {'id': ['BAT2']}),
+    ('four_substations', 'get_busbar_sections', {'id': ['S1VL2_BBS2']}),
+    ('four_substations', 'get_buses', {'id': ['S3VL1_0']}),
+    ('eurostag', 'get_generators', {'id': ['GEN2', 'GEN']}),
+    ('four_substations', 'get_hvdc_lines', {'id': ['HVDC2']}),
+    ('four_substations', 'get_lcc_converter_stations', {'id': ['LCC2']}),
+    ('four_substations', 'get_linear_shunt_compensator_sections', {'id': ['SHUNT']}),
+    ('four_substations', 'get_lines', {'id': ['LINE_S3S4']}),
+    ('four_substations', 'get_loads', {'id': ['LD4']}),
+    ('non_linear_shunt', 'get_non_linear_shunt_compensator_sections', {'id': ['SHUNT'], 'section': [1]}),
+    ('four_substations', 'get_phase_tap_changer_steps', {'id': ['TWT'], 'position': [6]}),
+    ('four_substations', 'get_phase_tap_changers', {'id': ['TWT']}),
+    ('eurostag', 'get_ratio_tap_changer_steps', {'id': ['NHV2_NLOAD', 'NHV2_NLOAD'], 'position': [0, 2]}),
+    ('eurostag', 'get_ratio_tap_changers', {'id': ['NHV2_NLOAD']}),
+    ('four_substations', 'get_static_var_compensators', {'id': ['SVC']}),
+    ('eurostag', 'get_substations', {'id': ['P2']}),
+    ('four_substations', 'get_switches', {'id': ['S1VL2_GH1_BREAKER', 'S4VL1_BBS_SVC_DISCONNECTOR', 'S1VL2_COUPLER']}),
+    ('four_substations', 'get_voltage_levels', {'id': ['S2VL1']}),
+    ('four_substations', 'get_vsc_converter_stations', {'id': ['VSC2']}),
+]
+
+# expected MultiIndex of the cases filtering on several index levels, named after the filters
+_ELEMENTS_FILTERING_KEYS = {getter: pd.MultiIndex.from_arrays(list(filters.values()), names=list(filters))
+                            for _, getter, filters in _ELEMENTS_FILTERING_CASES if len(filters) > 1}
+
+# Reference networks shared by all the tests of this module which only read them:
+# tests which modify a network must create their own instance.
+_NETWORK_FACTORIES = {
+    'eurostag': pp.network.create_eurostag_tutorial_example1_network,
+    'four_substations': pp.network.create_four_substations_node_breaker_network,
+    'ieee14': pp.network.create_ieee14,
+    'battery': lambda: pp.network.load_from_string('battery.xiidm', _BATTERY_XML),
+    'micro_grid_be': pp.network.create_micro_grid_be_network,
+    'non_linear_shunt': util.create_non_linear_shunt_network,
+    'dangling_lines': util.create_dangling_lines_network,
+    'eurostag_power_limits': pp.network.create_eurostag_tutorial_example1_with_power_limits_network,
+    '3wt_current_limits': util.create_three_windings_transformer_with_current_limits_network,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _network(name):
+    """
+    Shared reference network, built the first time a test of the current process asks for it.
+    """
+    return _NETWORK_FACTORIES[name]()
+
+
+def _select_limits(limits, element_id, name):
+    """
+    Limits of the given name of one element, selected with a single positional lookup.
+    """
+    mask = (limits.index.values == element_id) & (limits['name'].values == name)
+    return limits.take(np.flatnonzero(mask))
+
+
+@contextlib.contextmanager
+def _scratch_variant(network):
+    """
+    Works on a copy of the current variant of the network, which is dropped on exit:
+    only state variables (switch positions, generator targets, ...) are restored.
+    """
+    initial_variant = network.get_working_variant_id()
+    network.clone_variant(initial_variant, 'scratch')
+    network.set_working_variant('scratch')
+    try:
+        yield network
+    finally:
+        network.set_working_variant(initial_variant)
+        network.remove_variant('scratch')
 
 
 class NetworkTestCase(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls._import_formats = pp.network.get_import_formats()
+        cls._export_formats = pp.network.get_export_formats()
+        cls._import_parameters = {fmt: pp.network.get_import_parameters(fmt) for fmt in ['PSS/E']}
+        cls._export_parameters = {fmt: pp.network.get_export_parameters(fmt) for fmt in ['CGMES']}
+
     @staticmethod
     def test_print_version():
         pp.print_version()
@@ -44,17 +616,14 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertEqual(1, len(n.get_substations()))
 
     def test_dump_to_string(self):
-        bat_path = TEST_DIR.joinpath('battery.xiidm')
-        xml = bat_path.read_text()
-        n = pp.network.load(str(bat_path))
-        self.assertEqual(xml, n.dump_to_string())
+        self.assertEqual(_BATTERY_XML, _network('battery').dump_to_string())
 
     def test_get_import_format(self):
-        formats = pp.network.get_import_formats()
+        formats = self._import_formats
         self.assertEqual(['CGMES', 'MATPOWER', 'IEEE-CDF', 'PSS/E', 'UCTE', 'XIIDM', 'POWER-FACTORY'], formats)
 
     def test_get_import_parameters(self):
-        parameters = pp.network.get_import_parameters('PSS/E')
+        parameters = self._import_parameters['PSS/E']
         self.assertEqual(1, len(parameters))
         self.assertEqual(['psse.import.ignore-base-voltage'], parameters.index.tolist())
         self.assertEqual('Ignore base voltage specified in the file',
@@ -63,8 +632,7 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertEqual('false', parameters['default']['psse.import.ignore-base-voltage'])
 
     def test_get_export_parameters(self):
-        parameters = pp.network.get_export_parameters('CGMES')
-        print(parameters.index.tolist())
+        parameters = self._export_parameters['CGMES']
         self.assertEqual(4, len(parameters))
         name = 'iidm.export.cgmes.export-boundary-power-flows'
         self.assertEqual(name, parameters.index.tolist()[1])
@@ -75,7 +643,7 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertEqual('true', parameters['default'][name])
 
     def test_get_export_format(self):
-        formats = pp.network.get_export_formats()
+        formats = self._export_formats
         self.assertEqual(['CGMES', 'PSS/E', 'UCTE', 'XIIDM'], formats)
 
     def test_load_network(self):
@@ -92,7 +660,7 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertTrue(n.connect('L1-2-1'))
 
     def test_network_attributes(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
+        n = _network('eurostag')
         self.assertEqual('sim1', n.id)
         self.assertEqual(datetime.datetime(2018, 1, 1, 10, 0), n.case_date)
         self.assertEqual('sim1', n.name)
@@ -100,14 +668,14 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertEqual('test', n.source_format)
 
     def test_network_representation(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
+        n = _network('eurostag')
         expected = 'Network(id=sim1, name=sim1, case_date=2018-01-01 10:00:00, ' \
                    'forecast_distance=0:00:00, source_format=test)'
         self.assertEqual(expected, str(n))
         self.assertEqual(expected, repr(n))
 
     def test_get_network_element_ids(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
+        n = _network('eurostag')
         self.assertEqual(['NGEN_NHV1', 'NHV2_NLOAD'],
                          n.get_elements_ids(pp.network.ElementType.TWO_WINDINGS_TRANSFORMER))
         self.assertEqual(['NGEN_NHV1'], n.get_elements_ids(element_type=pp.network.ElementType.TWO_WINDINGS_TRANSFORMER,
@@ -125,28 +693,112 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertEqual([], n.get_elements_ids(element_type=pp.network.ElementType.TWO_WINDINGS_TRANSFORMER,
                                                 nominal_voltages={24}, countries={'BE'}))
 
-    def test_buses(self):
+    def test_update_unknown_data(self):
         n = pp.network.create_eurostag_tutorial_example1_network()
-        buses = n.get_buses()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['VLGEN_0', 'VLHV1_0', 'VLHV2_0', 'VLLOAD_0']),
-                                columns=['name', 'v_mag', 'v_angle', 'connected_component', 'synchronous_component',
-                                         'voltage_level_id'],
-                                data=[['', NaN, NaN, 0, 0, 'VLGEN'],
-                                      ['', 380, NaN, 0, 0, 'VLHV1'],
-                                      ['', 380, NaN, 0, 0, 'VLHV2'],
-                                      ['', NaN, NaN, 0, 0, 'VLLOAD']])
-        pd.testing.assert_frame_equal(expected, buses, check_dtype=False)
+        update = pd.DataFrame(data=[['blob']], columns=['unknown'], index=['GEN'])
+        with self.assertRaises(ValueError) as context:
+            n.update_generators(update)
+        self.assertIn('No column named unknown', str(context.exception.args))
 
-        n.update_buses(pd.DataFrame(index=['VLGEN_0'], columns=['v_mag', 'v_angle'], data=[[400, 0]]))
-        buses = n.get_buses()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['VLGEN_0', 'VLHV1_0', 'VLHV2_0', 'VLLOAD_0']),
-                                columns=['name', 'v_mag', 'v_angle', 'connected_component', 'synchronous_component',
-                                         'voltage_level_id'],
-                                data=[['', 400, 0, 0, 0, 'VLGEN'],
-                                      ['', 380, NaN, 0, 0, 'VLHV1'],
-                                      ['', 380, NaN, 0, 0, 'VLHV2'],
-                                      ['', NaN, NaN, 0, 0, 'VLLOAD']])
-        pd.testing.assert_frame_equal(expected, buses, check_dtype=False)
+    def test_update_non_modifiable_data(self):
+        n = pp.network.create_eurostag_tutorial_example1_network()
+        update = pd.DataFrame(data=[['blob']], columns=['voltage_level_id'], index=['GEN'])
+        with self.assertRaises(pp.PyPowsyblError) as context:
+            n.update_generators(update)
+        self.assertIn('Series \'voltage_level_id\' is not modifiable.', str(context.exception.args))
+
+    def test_exception(self):
+        n = _network('ieee14')
+        try:
+            n.open_switch("aa")
+            self.fail()
+        except pp.PyPowsyblError as e:
+            self.assertEqual("Switch 'aa' not found", str(e))
+
+    def test_variant(self):
+        n = pp.network.load(str(TEST_DIR.joinpath('node-breaker.xiidm')))
+        self.assertEqual('InitialState', n.get_working_variant_id())
+        n.clone_variant('InitialState', 'WorkingState')
+        n.update_switches(pd.DataFrame(index=['BREAKER-BB2-VL1_VL2_1'], data={'open': [True]}))
+        n.set_working_variant('WorkingState')
+        self.assertEqual('WorkingState', n.get_working_variant_id())
+        self.assertEqual(['InitialState', 'WorkingState'], n.get_variant_ids())
+        switches = n.get_switches()
+        self.assertEqual(0, len(switches.index[switches['open']].tolist()))
+        n.set_working_variant('InitialState')
+        n.remove_variant('WorkingState')
+        switches = n.get_switches()
+        self.assertEqual(['BREAKER-BB2-VL1_VL2_1'], switches.index[switches['open']].tolist())
+        self.assertEqual('InitialState', n.get_working_variant_id())
+        self.assertEqual(1, len(n.get_variant_ids()))
+
+    def test_sld_svg(self):
+        n = _network('four_substations')
+        sld = n.get_single_line_diagram('S1VL1')
+        self.assertIn('<svg', sld.svg)
+
+    def test_sld_nad(self):
+        n = _network('ieee14')
+        sld = n.get_network_area_diagram()
+        self.assertIn('<svg', sld.svg)
+        sld = n.get_network_area_diagram(voltage_level_ids=None)
+        self.assertIn('<svg', sld.svg)
+        sld = n.get_network_area_diagram('VL1')
+        self.assertIn('<svg', sld.svg)
+        sld = n.get_network_area_diagram(['VL1', 'VL2'])
+        self.assertIn('<svg', sld.svg)
+        with tempfile.TemporaryDirectory() as tmp_dir_name:
+            test_svg = os.path.join(tmp_dir_name, "test.svg")
+            n.write_network_area_diagram_svg(test_svg, None)
+            n.write_network_area_diagram_svg(test_svg, ['VL1'])
+            n.write_network_area_diagram_svg(test_svg, ['VL1', 'VL2'])
+
+    def test_deep_copy(self):
+        n = _network('eurostag')
+        copy_n = copy.deepcopy(n)
+        self.assertEqual(n.id, copy_n.id)
+        self.assertEqual(['NGEN_NHV1', 'NHV2_NLOAD'],
+                         copy_n.get_elements_ids(pp.network.ElementType.TWO_WINDINGS_TRANSFORMER))
+
+    def test_invalid_update_kwargs(self):
+        n = pp.network.create_four_substations_node_breaker_network()
+
+        with self.assertRaises(RuntimeError) as context:
+            n.update_generators(df=pd.DataFrame(index=['GTH1'], columns=['target_p'], data=[300]),
+                                id='GTH1', target_p=300)
+        self.assertIn('only one form', str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            n.update_generators(id=['GTH1', 'GTH2'], target_p=100)
+        self.assertIn('same size', str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            n.update_generators(id=np.array(0, ndmin=3))
+        self.assertIn('dimensions', str(context.exception))
+
+    def test_create_network(self):
+        n = pp.network.create_ieee9()
+        self.assertEqual('ieee9cdf', n.id)
+        n = pp.network.create_ieee30()
+        self.assertEqual('ieee30cdf', n.id)
+        n = pp.network.create_ieee57()
+        self.assertEqual('ieee57cdf', n.id)
+        n = pp.network.create_ieee118()
+        self.assertEqual('ieee118cdf', n.id)
+
+    def test_network_merge(self):
+        be = pp.network.create_micro_grid_be_network()
+        self.assertEqual(6, len(be.get_voltage_levels()))
+        nl = pp.network.create_micro_grid_nl_network()
+        self.assertEqual(4, len(nl.get_voltage_levels()))
+        be.merge(nl)
+        self.assertEqual(10, len(be.get_voltage_levels()))
+
+
+class InjectionsTestCase(unittest.TestCase):
+    """
+    Loads, generators, batteries, HVDC converter stations and static var compensators.
+    """
 
     def test_loads_data_frame(self):
         n = pp.network.create_eurostag_tutorial_example1_network()
@@ -161,7 +813,7 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertEqual(500, df3['p0']['LOAD'])
 
     def test_batteries_data_frame(self):
-        n = pp.network.load(str(TEST_DIR.joinpath('battery.xiidm')))
+        n = pp.network.load_from_string('battery.xiidm', _BATTERY_XML)
         batteries = n.get_batteries()
         self.assertEqual(200.0, batteries['max_p']['BAT2'])
         df2 = pd.DataFrame(data=[[101, 201]], columns=['p0', 'q0'], index=['BAT2'])
@@ -190,23 +842,12 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         n = pp.network.create_four_substations_node_breaker_network()
         stations = n.get_lcc_converter_stations()
 
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['LCC1', 'LCC2']),
-                                columns=['name', 'power_factor', 'loss_factor', 'p', 'q', 'i', 'voltage_level_id',
-                                         'bus_id', 'connected'],
-                                data=[['LCC1', 0.6, 1.1, 80.88, NaN, NaN, 'S1VL2', 'S1VL2_0', True],
-                                      ['LCC2', 0.6, 1.1, - 79.12, NaN, NaN, 'S3VL1', 'S3VL1_0', True]])
-        pd.testing.assert_frame_equal(expected, stations, check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_LCC_INITIAL, stations)
         n.update_lcc_converter_stations(
             pd.DataFrame(index=['LCC1'],
                          columns=['power_factor', 'loss_factor', 'p', 'q'],
                          data=[[0.7, 1.2, 82, 69]]))
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['LCC1', 'LCC2']),
-                                columns=['name', 'power_factor', 'loss_factor', 'p', 'q', 'i', 'voltage_level_id',
-                                         'bus_id', 'connected'],
-                                data=[['LCC1', 0.7, 1.2, 82, 69, 154.68, 'S1VL2', 'S1VL2_0', True],
-                                      ['LCC2', 0.6, 1.1, - 79.12, NaN, NaN, 'S3VL1', 'S3VL1_0', True]])
-        pd.testing.assert_frame_equal(expected, n.get_lcc_converter_stations(), check_dtype=False, atol=10 ** -2)
+        pd.testing.assert_frame_equal(_EXPECTED_LCC_UPDATED, n.get_lcc_converter_stations(), atol=10 ** -2)
 
     def test_hvdc_data_frame(self):
         n = pp.network.create_four_substations_node_breaker_network()
@@ -220,32 +861,104 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
     def test_svc_data_frame(self):
         n = pp.network.create_four_substations_node_breaker_network()
         svcs = n.get_static_var_compensators()
-        expected = pd.DataFrame(
-            index=pd.Series(name='id', data=['SVC']),
-            columns=['name', 'b_min', 'b_max', 'target_v', 'target_q',
-                     'regulation_mode', 'p', 'q', 'i', 'voltage_level_id', 'bus_id',
-                     'connected'],
-            data=[['', -0.05, 0.05, 400, NaN, 'VOLTAGE', NaN, -12.54, NaN, 'S4VL1', 'S4VL1_0', True]])
-        pd.testing.assert_frame_equal(expected, svcs, check_dtype=False, atol=10 ** -2)
+        pd.testing.assert_frame_equal(_EXPECTED_SVC_INITIAL, svcs, atol=10 ** -2)
         n.update_static_var_compensators(pd.DataFrame(
-            index=pd.Series(name='id', data=['SVC']),
+            index=pd.Index(['SVC'], name='id'),
             columns=['b_min', 'b_max', 'target_v', 'target_q', 'regulation_mode', 'p', 'q'],
             data=[[-0.06, 0.06, 398, 100, 'REACTIVE_POWER', -12, -13]]))
 
         svcs = n.get_static_var_compensators()
-        expected = pd.DataFrame(
-            index=pd.Series(name='id', data=['SVC']),
-            columns=['name', 'b_min', 'b_max', 'target_v', 'target_q', 'regulation_mode', 'p', 'q', 'i',
-                     'voltage_level_id', 'bus_id', 'connected'],
-            data=[['', -0.06, 0.06, 398, 100, 'REACTIVE_POWER', -12, -13, 25.54, 'S4VL1', 'S4VL1_0', True]])
-        pd.testing.assert_frame_equal(expected, svcs, check_dtype=False, atol=10 ** -2)
+        pd.testing.assert_frame_equal(_EXPECTED_SVC_UPDATED, svcs, atol=10 ** -2)
 
     def test_create_generators_data_frame(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
+        n = _network('eurostag')
         generators = n.get_generators()
         self.assertEqual('OTHER', generators['energy_source']['GEN'])
         self.assertEqual(607, generators['target_p']['GEN'])
 
+    def test_update_generators_data_frame(self):
+        n = pp.network.create_eurostag_tutorial_example1_network()
+        generators = n.get_generators(attributes=['target_p', 'voltage_regulator_on', 'regulated_element_id'])
+        self.assertEqual(607, generators['target_p']['GEN'])
+        self.assertTrue(generators['voltage_regulator_on']['GEN'])
+        self.assertEqual('', generators['regulated_element_id']['GEN'])
+        generators2 = pd.DataFrame(data=[[608.0, 302.0, 25.0, False]],
+                                   columns=['target_p', 'target_q', 'target_v', 'voltage_regulator_on'], index=['GEN'])
+        n.update_generators(generators2)
+        generators = n.get_generators(attributes=['target_p', 'target_q', 'target_v', 'voltage_regulator_on'])
+        self.assertEqual(608, generators['target_p']['GEN'])
+        self.assertEqual(302.0, generators['target_q']['GEN'])
+        self.assertEqual(25.0, generators['target_v']['GEN'])
+        self.assertFalse(generators['voltage_regulator_on']['GEN'])
+
+    def test_reactive_capability_curve_points_data_frame(self):
+        n = _network('four_substations')
+        points = n.get_reactive_capability_curve_points()
+        np.testing.assert_allclose(points.loc['GH1'][['p', 'min_q', 'max_q']].to_numpy(),
+                                   [[0, -769.3, 860],
+                                    [100, -864.55, 946.25]], rtol=0, atol=1e-7)
+
+    def test_batteries(self):
+        n = util.create_battery_network()
+        pd.testing.assert_frame_equal(_EXPECTED_BATTERIES_INITIAL, n.get_batteries())
+        n.update_batteries(id='BAT2', p0=50, q0=100)
+        pd.testing.assert_frame_equal(_EXPECTED_BATTERIES_UPDATED, n.get_batteries(id=['BAT2']))
+
+    def test_update_generators_with_keywords(self):
+        with _scratch_variant(_network('four_substations')) as n:
+            n.update_generators(id=['GTH1', 'GTH2'], target_p=[200, 300])
+            self.assertEqual([200, 300], n.get_generators().loc[['GTH1', 'GTH2'], 'target_p'].to_list())
+
+
+class LinesTestCase(unittest.TestCase):
+    """
+    Lines, dangling lines and their limits.
+    """
+
+    def test_current_limits(self):
+        current_limits = _network('eurostag').get_current_limits()
+        self.assertEqual(9, len(current_limits))
+        self.assertEqual(5, np.count_nonzero(current_limits.index.get_level_values('branch_id') == 'NHV1_NHV2_1'))
+        positions = current_limits.index.get_indexer_for(_MI_CURRENT_LIMIT)
+        # get_indexer_for returns -1 for a missing key, which take would silently read as the last row
+        self.assertTrue((positions >= 0).all())
+        current_limit = current_limits.take(positions)
+        expected = pd.DataFrame(index=_MI_CURRENT_LIMIT,
+                                data={'side': ['TWO'],
+                                      'value': [1200.0],
+                                      'acceptable_duration': np.array([600], dtype=np.int32),
+                                      'is_fictitious': [False]})
+        pd.testing.assert_frame_equal(expected, current_limit)
+
+    def test_lines(self):
+        n = pp.network.create_four_substations_node_breaker_network()
+        pd.testing.assert_frame_equal(_EXPECTED_LINES_INITIAL, n.get_lines())
+        n.update_lines(id='LINE_S2S3', r=1, x=2, g1=3, b1=4, g2=5, b2=6, p1=7, q1=8, p2=9, q2=10)
+        pd.testing.assert_frame_equal(_EXPECTED_LINES_UPDATED, n.get_lines(id=['LINE_S2S3']))
+
+    def test_dangling_lines(self):
+        n = util.create_dangling_lines_network()
+        pd.testing.assert_frame_equal(_EXPECTED_DANGLING_LINES_INITIAL, n.get_dangling_lines())
+        n.update_dangling_lines(id='DL', r=11.0, x=1.1, g=0.0002, b=0.00002, p0=40.0, q0=40.0, connected=False)
+        pd.testing.assert_frame_equal(_EXPECTED_DANGLING_LINES_UPDATED, n.get_dangling_lines())
+
+    def test_limits(self):
+        pd.testing.assert_frame_equal(_EXPECTED_DL_LIMITS, _network('dangling_lines').get_operational_limits())
+
+        all_limits = _network('eurostag_power_limits').get_operational_limits()
+        limits = _select_limits(all_limits, 'NHV1_NHV2_1', 'permanent_limit')
+        pd.testing.assert_frame_equal(_EXPECTED_NHV1_NHV2_1_PERMANENT_LIMITS, limits)
+        limits = _select_limits(all_limits, 'NHV1_NHV2_2', '20\'')
+        pd.testing.assert_frame_equal(_EXPECTED_NHV1_NHV2_2_20_LIMITS, limits)
+        limits = _select_limits(_network('3wt_current_limits').get_operational_limits(), '3WT', '10\'')
+        pd.testing.assert_frame_equal(_EXPECTED_3WT_10_LIMITS, limits)
+
+
+class TransformersTestCase(unittest.TestCase):
+    """
+    Transformers and their tap changers.
+    """
+
     def test_ratio_tap_changer_steps_data_frame(self):
         n = pp.network.create_eurostag_tutorial_example1_network()
         steps = n.get_ratio_tap_changer_steps()
@@ -254,34 +967,23 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         expected = pd.DataFrame(
             index=pd.MultiIndex.from_tuples([('NHV2_NLOAD', 0), ('NHV2_NLOAD', 1), ('NHV2_NLOAD', 2)],
                                             names=['id', 'position']),
-            columns=['rho', 'r', 'x', 'g', 'b'],
-            data=[[0.850567, 0, 0, 0, 0],
-                  [1.00067, 0, 0, 0, 0],
-                  [1.15077, 0, 0, 0, 0]])
-        pd.testing.assert_frame_equal(expected, steps, check_dtype=False)
-        n.update_ratio_tap_changer_steps(pd.DataFrame(
-            index=pd.MultiIndex.from_tuples([('NHV2_NLOAD', 0), ('NHV2_NLOAD', 1)],
-                                            names=['id', 'position']), columns=['rho', 'r', 'x', 'g', 'b'],
-            data=[[1, 1, 1, 1, 1],
-                  [1, 1, 1, 1, 1]]))
+            data={'rho': [0.850567, 1.00067, 1.15077],
+                  'r': [0.0, 0.0, 0.0],
+                  'x': [0.0, 0.0, 0.0],
+                  'g': [0.0, 0.0, 0.0],
+                  'b': [0.0, 0.0, 0.0]})
+        pd.testing.assert_frame_equal(expected, steps)
+        n.update_ratio_tap_changer_steps(id=['NHV2_NLOAD', 'NHV2_NLOAD'], position=[0, 1], rho=[2, 1], r=[3, 1],
+                                         x=[4, 1], g=[5, 1], b=[6, 1])
         expected = pd.DataFrame(
             index=pd.MultiIndex.from_tuples([('NHV2_NLOAD', 0), ('NHV2_NLOAD', 1), ('NHV2_NLOAD', 2)],
                                             names=['id', 'position']),
-            columns=['rho', 'r', 'x', 'g', 'b'],
-            data=[[1, 1, 1, 1, 1],
-                  [1, 1, 1, 1, 1],
-                  [1.15077, 0, 0, 0, 0]])
-        pd.testing.assert_frame_equal(expected, n.get_ratio_tap_changer_steps(), check_dtype=False)
-        n.update_ratio_tap_changer_steps(id='NHV2_NLOAD', position=0, rho=2, r=3, x=4, g=5, b=6)
-
-        expected = pd.DataFrame.from_records(
-            index=['id', 'position'],
-            columns=['id', 'position', 'rho', 'r', 'x', 'g', 'b'],
-            data=[('NHV2_NLOAD', 0, 2, 3, 4, 5, 6),
-                  ('NHV2_NLOAD', 1, 1, 1, 1, 1, 1),
-                  ('NHV2_NLOAD', 2, 1.15077, 0, 0, 0, 0)])
-
-        pd.testing.assert_frame_equal(expected, n.get_ratio_tap_changer_steps(), check_dtype=False)
+            data={'rho': np.array([2, 1, 1.15077], dtype=float),
+                  'r': np.array([3, 1, 0], dtype=float),
+                  'x': np.array([4, 1, 0], dtype=float),
+                  'g': np.array([5, 1, 0], dtype=float),
+                  'b': np.array([6, 1, 0], dtype=float)})
+        pd.testing.assert_frame_equal(expected, n.get_ratio_tap_changer_steps())
 
     def test_phase_tap_changer_steps_data_frame(self):
         n = pp.network.create_ieee300()
@@ -291,90 +993,18 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
             index=pd.MultiIndex.from_tuples([('T196-2040-1', 0)],
                                             names=['id', 'position']),
             columns=['rho', 'alpha', 'r', 'x', 'g', 'b'],
-            data=[[1, 11.4, 0, 0, 0, 0]])
-        pd.testing.assert_frame_equal(expected, n.get_phase_tap_changer_steps(), check_dtype=False)
+            data=[[1.0, 11.4, 0.0, 0.0, 0.0, 0.0]])
+        pd.testing.assert_frame_equal(expected, n.get_phase_tap_changer_steps())
         n.update_phase_tap_changer_steps(pd.DataFrame(
             index=pd.MultiIndex.from_tuples([('T196-2040-1', 0)],
                                             names=['id', 'position']), columns=['alpha', 'rho', 'r', 'x', 'g', 'b'],
-            data=[[1, 1, 1, 1, 1, 1]]))
-        expected = pd.DataFrame(
-            index=pd.MultiIndex.from_tuples([('T196-2040-1', 0)],
-                                            names=['id', 'position']),
-            columns=['rho', 'alpha', 'r', 'x', 'g', 'b'],
-            data=[[1, 1, 1, 1, 1, 1]])
-        pd.testing.assert_frame_equal(expected, n.get_phase_tap_changer_steps(), check_dtype=False)
-        n.update_phase_tap_changer_steps(id=['T196-2040-1'], position=[0], rho=[2], alpha=[7], r=[3], x=[4], g=[5],
-                                         b=[6])
+            data=[[7, 2, 3, 4, 5, 6]]))
         expected = pd.DataFrame(
             index=pd.MultiIndex.from_tuples([('T196-2040-1', 0)],
                                             names=['id', 'position']),
             columns=['rho', 'alpha', 'r', 'x', 'g', 'b'],
-            data=[[2, 7, 3, 4, 5, 6]])
-        pd.testing.assert_frame_equal(expected, n.get_phase_tap_changer_steps(), check_dtype=False)
-
-    def test_update_generators_data_frame(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        generators = n.get_generators()
-        self.assertEqual(607, generators['target_p']['GEN'])
-        self.assertTrue(generators['voltage_regulator_on']['GEN'])
-        self.assertEqual('', generators['regulated_element_id']['GEN'])
-        generators2 = pd.DataFrame(data=[[608.0, 302.0, 25.0, False]],
-                                   columns=['target_p', 'target_q', 'target_v', 'voltage_regulator_on'], index=['GEN'])
-        n.update_generators(generators2)
-        generators = n.get_generators()
-        self.assertEqual(608, generators['target_p']['GEN'])
-        self.assertEqual(302.0, generators['target_q']['GEN'])
-        self.assertEqual(25.0, generators['target_v']['GEN'])
-        self.assertFalse(generators['voltage_regulator_on']['GEN'])
-
-    def test_regulated_terminal_node_breaker(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        gens = n.get_generators()
-        print(n.get_lines())
-        self.assertEqual('GH1', gens['regulated_element_id']['GH1'])
-
-        n.update_generators(id='GH1', regulated_element_id='S1VL1_BBS')
-        updated_gens = n.get_generators()
-        self.assertEqual('S1VL1_BBS', updated_gens['regulated_element_id']['GH1'])
-
-        with self.assertRaises(pp.PyPowsyblError):
-            n.update_generators(id='GH1', regulated_element_id='LINE_S2S3')
-
-    def test_regulated_terminal_bus_breaker(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        generators = n.get_generators()
-        self.assertEqual('', generators['regulated_element_id']['GEN'])
-
-        with self.assertRaises(pp.PyPowsyblError):
-            n.update_generators(id='GEN', regulated_element_id='NHV1')
-        with self.assertRaises(pp.PyPowsyblError):
-            n.update_generators(id='GEN', regulated_element_id='LOAD')
-
-    def test_update_unknown_data(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        update = pd.DataFrame(data=[['blob']], columns=['unknown'], index=['GEN'])
-        with self.assertRaises(ValueError) as context:
-            n.update_generators(update)
-        self.assertIn('No column named unknown', str(context.exception.args))
-
-    def test_update_non_modifiable_data(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        update = pd.DataFrame(data=[['blob']], columns=['voltage_level_id'], index=['GEN'])
-        with self.assertRaises(pp.PyPowsyblError) as context:
-            n.update_generators(update)
-        self.assertIn('Series \'voltage_level_id\' is not modifiable.', str(context.exception.args))
-
-    def test_update_switches_data_frame(self):
-        n = pp.network.load(str(TEST_DIR.joinpath('node-breaker.xiidm')))
-        switches = n.get_switches()
-        # no open switch
-        open_switches = switches[switches['open']].index.tolist()
-        self.assertEqual(0, len(open_switches))
-        # open 1 breaker
-        n.update_switches(pd.DataFrame(index=['BREAKER-BB2-VL1_VL2_1'], data={'open': [True]}))
-        switches = n.get_switches()
-        open_switches = switches[switches['open']].index.tolist()
-        self.assertEqual(['BREAKER-BB2-VL1_VL2_1'], open_switches)
+            data=[[2.0, 7.0, 3.0, 4.0, 5.0, 6.0]])
+        pd.testing.assert_frame_equal(expected, n.get_phase_tap_changer_steps())
 
     def test_update_2_windings_transformers_data_frame(self):
         n = pp.network.create_eurostag_tutorial_example1_network()
@@ -383,86 +1013,23 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
             ['name', 'r', 'x', 'g', 'b', 'rated_u1', 'rated_u2', 'rated_s', 'p1', 'q1', 'i1', 'p2', 'q2', 'i2',
              'voltage_level1_id', 'voltage_level2_id', 'bus1_id', 'bus2_id', 'connected1', 'connected2'],
             df.columns.tolist())
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['NGEN_NHV1', 'NHV2_NLOAD']),
-                                columns=['name', 'r', 'x', 'g', 'b', 'rated_u1', 'rated_u2', 'rated_s', 'p1', 'q1',
-                                         'i1', 'p2',
-                                         'q2', 'i2', 'voltage_level1_id', 'voltage_level2_id', 'bus1_id', 'bus2_id',
-                                         'connected1', 'connected2'],
-                                data=[['', 0.27, 11.10, 0, 0, 24, 400, NaN, NaN, NaN, NaN, NaN, NaN,
-                                       NaN, 'VLGEN', 'VLHV1', 'VLGEN_0', 'VLHV1_0', True, True],
-                                      ['', 0.05, 4.05, 0, 0, 400, 158, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
-                                       'VLHV2', 'VLLOAD', 'VLHV2_0', 'VLLOAD_0', True, True]])
-        pd.testing.assert_frame_equal(expected, n.get_2_windings_transformers(), check_dtype=False, atol=10 ** -2)
+        pd.testing.assert_frame_equal(_EXPECTED_2WT_INITIAL, n.get_2_windings_transformers(), atol=10 ** -2)
         n.update_2_windings_transformers(
             pd.DataFrame(index=['NGEN_NHV1'],
                          columns=['r', 'x', 'g', 'b', 'rated_u1', 'rated_u2', 'connected1', 'connected2'],
                          data=[[0.3, 11.2, 1, 1, 90, 225, False, False]]))
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['NGEN_NHV1', 'NHV2_NLOAD']),
-                                columns=['name', 'r', 'x', 'g', 'b', 'rated_u1', 'rated_u2', 'rated_s', 'p1', 'q1',
-                                         'i1', 'p2',
-                                         'q2', 'i2', 'voltage_level1_id', 'voltage_level2_id', 'bus1_id', 'bus2_id',
-                                         'connected1', 'connected2'],
-                                data=[['', 0.3, 11.2, 1, 1, 90, 225, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
-                                       'VLGEN', 'VLHV1', '', '', False, False],
-                                      ['', 0.047, 4.05, 0, 0, 400, 158, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
-                                       'VLHV2', 'VLLOAD', 'VLHV2_0', 'VLLOAD_0', True, True]])
-        pd.testing.assert_frame_equal(expected, n.get_2_windings_transformers(), check_dtype=False, atol=10 ** -2)
-
-    def test_voltage_levels_data_frame(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        voltage_levels = n.get_voltage_levels()
-        self.assertEqual(24.0, voltage_levels['nominal_v']['VLGEN'])
-
-    def test_substations_data_frame(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['P1', 'P2']),
-                                columns=['name', 'TSO', 'geo_tags', 'country'],
-                                data=[['', 'RTE', 'A', 'FR'],
-                                      ['', 'RTE', 'B', 'BE']])
-        pd.testing.assert_frame_equal(expected, n.get_substations(), check_dtype=False, atol=10 ** -2)
-        n.update_substations(id='P2', TSO='REE', country='ES')
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['P1', 'P2']),
-                                columns=['name', 'TSO', 'geo_tags', 'country'],
-                                data=[['', 'RTE', 'A', 'FR'],
-                                      ['', 'REE', 'B', 'ES']])
-        pd.testing.assert_frame_equal(expected, n.get_substations(), check_dtype=False, atol=10 ** -2)
-
-    def test_reactive_capability_curve_points_data_frame(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        points = n.get_reactive_capability_curve_points()
-        self.assertAlmostEqual(0, points.loc['GH1']['p'][0])
-        self.assertAlmostEqual(100, points.loc['GH1']['p'][1])
-        self.assertAlmostEqual(-769.3, points.loc['GH1']['min_q'][0])
-        self.assertAlmostEqual(-864.55, points.loc['GH1']['min_q'][1])
-        self.assertAlmostEqual(860, points.loc['GH1']['max_q'][0])
-        self.assertAlmostEqual(946.25, points.loc['GH1']['max_q'][1])
-
-    def test_exception(self):
-        n = pp.network.create_ieee14()
-        try:
-            n.open_switch("aa")
-            self.fail()
-        except pp.PyPowsyblError as e:
-            self.assertEqual("Switch 'aa' not found", str(e))
+        pd.testing.assert_frame_equal(_EXPECTED_2WT_UPDATED, n.get_2_windings_transformers(), atol=10 ** -2)
 
     def test_ratio_tap_changers(self):
         n = pp.network.create_eurostag_tutorial_example1_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['NHV2_NLOAD']),
-                                columns=['tap', 'low_tap', 'high_tap', 'step_count', 'on_load', 'regulating',
-                                         'target_v', 'target_deadband', 'regulating_bus_id', 'rho',
-                                         'alpha'],
-                                data=[[1, 0, 2, 3, True, True, 158.0, 0.0, 'VLLOAD_0', 0.4, NaN]])
-        pd.testing.assert_frame_equal(expected, n.get_ratio_tap_changers(), check_dtype=False, atol=10 ** -2)
+        pd.testing.assert_frame_equal(_EXPECTED_RATIO_TAP_CHANGERS_INITIAL, n.get_ratio_tap_changers(),
+                                      atol=10 ** -2)
         update = pd.DataFrame(index=['NHV2_NLOAD'],
                               columns=['tap', 'regulating', 'target_v'],
                               data=[[0, False, 180]])
         n.update_ratio_tap_changers(update)
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['NHV2_NLOAD']),
-                                columns=['tap', 'low_tap', 'high_tap', 'step_count', 'on_load', 'regulating',
-                                         'target_v', 'target_deadband', 'regulating_bus_id', 'rho',
-                                         'alpha'],
-                                data=[[0, 0, 2, 3, True, False, 180.0, 0.0, 'VLLOAD_0', 0.34, NaN]])
-        pd.testing.assert_frame_equal(expected, n.get_ratio_tap_changers(), check_dtype=False, atol=10 ** -2)
+        pd.testing.assert_frame_equal(_EXPECTED_RATIO_TAP_CHANGERS_UPDATED, n.get_ratio_tap_changers(),
+                                      atol=10 ** -2)
 
     def test_phase_tap_changers(self):
         n = pp.network.create_four_substations_node_breaker_network()
@@ -492,295 +1059,146 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
         self.assertAlmostEqual(1000, twt_values.regulation_value, 1)
         self.assertAlmostEqual(100, twt_values.target_deadband, 1)
 
-    def test_variant(self):
-        n = pp.network.load(str(TEST_DIR.joinpath('node-breaker.xiidm')))
-        self.assertEqual('InitialState', n.get_working_variant_id())
-        n.clone_variant('InitialState', 'WorkingState')
-        n.update_switches(pd.DataFrame(index=['BREAKER-BB2-VL1_VL2_1'], data={'open': [True]}))
-        n.set_working_variant('WorkingState')
-        self.assertEqual('WorkingState', n.get_working_variant_id())
-        self.assertEqual(['InitialState', 'WorkingState'], n.get_variant_ids())
-        self.assertEqual(0, len(n.get_switches()[n.get_switches()['open']].index.tolist()))
-        n.set_working_variant('InitialState')
-        n.remove_variant('WorkingState')
-        self.assertEqual(['BREAKER-BB2-VL1_VL2_1'], n.get_switches()[n.get_switches()['open']].index.tolist())
-        self.assertEqual('InitialState', n.get_working_variant_id())
-        self.assertEqual(1, len(n.get_variant_ids()))
+    def test_3_windings_transformers(self):
+        n = util.create_three_windings_transformer_network()
+        pd.testing.assert_frame_equal(_EXPECTED_3WT, n.get_3_windings_transformers())
+        # test update
 
-    def test_sld_svg(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        sld = n.get_single_line_diagram('S1VL1')
-        self.assertRegex(sld.svg, '.*<svg.*')
 
-    def test_sld_nad(self):
-        n = pp.network.create_ieee14()
-        sld = n.get_network_area_diagram()
-        self.assertRegex(sld.svg, '.*<svg.*')
-        sld = n.get_network_area_diagram(voltage_level_ids=None)
-        self.assertRegex(sld.svg, '.*<svg.*')
-        sld = n.get_network_area_diagram('VL1')
-        self.assertRegex(sld.svg, '.*<svg.*')
-        sld = n.get_network_area_diagram(['VL1', 'VL2'])
-        self.assertRegex(sld.svg, '.*<svg.*')
-        with tempfile.TemporaryDirectory() as tmp_dir_name:
-            test_svg = tmp_dir_name + "test.svg"
-            n.write_network_area_diagram_svg(test_svg, None)
-            n.write_network_area_diagram_svg(test_svg, ['VL1'])
-            n.write_network_area_diagram_svg(test_svg, ['VL1', 'VL2'])
+class ShuntTestCase(unittest.TestCase):
+    """
+    Shunt compensators and their sections.
+    """
 
-    def test_current_limits(self):
-        network = pp.network.create_eurostag_tutorial_example1_network()
-        self.assertEqual(9, len(network.get_current_limits()))
-        self.assertEqual(5, len(network.get_current_limits().loc['NHV1_NHV2_1']))
-        current_limit = network.get_current_limits().loc['NHV1_NHV2_1', '10\'']
-        expected = pd.DataFrame(index=pd.MultiIndex.from_tuples(names=['branch_id', 'name'],
-                                                                tuples=[('NHV1_NHV2_1', '10\'')]),
-                                columns=['side', 'value', 'acceptable_duration', 'is_fictitious'],
-                                data=[['TWO', 1200.0, 600, False]])
-        pd.testing.assert_frame_equal(expected, current_limit, check_dtype=False)
+    def test_shunt(self):
+        n = pp.network.create_four_substations_node_breaker_network()
+        pd.testing.assert_frame_equal(_EXPECTED_SHUNT_INITIAL, n.get_shunt_compensators())
+        n.update_shunt_compensators(id='SHUNT', q=1900, section_count=0, target_v=50, target_deadband=3,
+                                    connected=False, voltage_regulation_on=True)
+        pd.testing.assert_frame_equal(_EXPECTED_SHUNT_UPDATED, n.get_shunt_compensators())
 
-    def test_deep_copy(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        copy_n = copy.deepcopy(n)
-        self.assertEqual(['NGEN_NHV1', 'NHV2_NLOAD'],
-                         copy_n.get_elements_ids(pp.network.ElementType.TWO_WINDINGS_TRANSFORMER))
+    def test_non_linear_shunt(self):
+        n = util.create_non_linear_shunt_network()
+        pd.testing.assert_frame_equal(_EXPECTED_NON_LINEAR_SHUNT_SECTIONS_INITIAL,
+                                      n.get_non_linear_shunt_compensator_sections())
+        n.update_non_linear_shunt_compensator_sections(id=['SHUNT', 'SHUNT'], section=[0, 1], g=[0.1, 0.4],
+                                                       b=[0.00002, 0.03])
+        pd.testing.assert_frame_equal(_EXPECTED_NON_LINEAR_SHUNT_SECTIONS_UPDATED,
+                                      n.get_non_linear_shunt_compensator_sections())
 
-    def test_lines(self):
+    def test_update_with_keywords(self):
+        n = util.create_non_linear_shunt_network()
+        n.update_non_linear_shunt_compensator_sections(id='SHUNT', section=0, g=0.2, b=0.000001)
+        sections = n.get_non_linear_shunt_compensator_sections(id=['SHUNT'], section=[0])
+        self.assertEqual(0.2, sections.loc['SHUNT', 0]['g'])
+        self.assertEqual(0.000001, sections.loc['SHUNT', 0]['b'])
+
+    def test_linear_shunt_compensator_sections(self):
         n = pp.network.create_four_substations_node_breaker_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['LINE_S2S3', 'LINE_S3S4']),
-                                columns=['name', 'r', 'x', 'g1', 'b1', 'g2', 'b2', 'p1', 'q1', 'i1', 'p2', 'q2', 'i2',
-                                         'voltage_level1_id',
-                                         'voltage_level2_id', 'bus1_id', 'bus2_id', 'connected1', 'connected2'],
-                                data=[
-                                    ['', 0.01, 19.1, 0, 0, 0, 0, 109.889, 190.023, 309.979, -109.886, -184.517, 309.978,
-                                     'S2VL1',
-                                     'S3VL1',
-                                     'S2VL1_0', 'S3VL1_0', True, True],
-                                    ['', 0.01, 13.1, 0, 0, 0, 0, 240.004, 2.1751, 346.43, -240, 2.5415, 346.43, 'S3VL1',
-                                     'S4VL1',
-                                     'S3VL1_0', 'S4VL1_0', True, True]])
-        pd.testing.assert_frame_equal(expected, n.get_lines(), check_dtype=False)
-        lines_update = pd.DataFrame(index=['LINE_S2S3'],
-                                    columns=['r', 'x', 'g1', 'b1', 'g2', 'b2', 'p1', 'q1', 'p2', 'q2'],
-                                    data=[[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]])
-        n.update_lines(lines_update)
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['LINE_S2S3', 'LINE_S3S4']),
-                                columns=['name', 'r', 'x', 'g1', 'b1', 'g2', 'b2', 'p1', 'q1', 'i1', 'p2', 'q2', 'i2',
-                                         'voltage_level1_id', 'voltage_level2_id', 'bus1_id', 'bus2_id', 'connected1',
-                                         'connected2'],
-                                data=[['', 1, 2, 3, 4, 5, 6, 7, 8, 15.011282, 9, 10, 19.418634,
-                                       'S2VL1', 'S3VL1', 'S2VL1_0', 'S3VL1_0', True, True],
-                                      ['', 0.01, 13.1, 0, 0, 0, 0, 240.004, 2.1751, 346.429584, -240, 2.5415,
-                                       346.429584, 'S3VL1', 'S4VL1', 'S3VL1_0', 'S4VL1_0', True, True]])
-        pd.testing.assert_frame_equal(expected, n.get_lines(), check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_LINEAR_SHUNT_SECTIONS_INITIAL,
+                                      n.get_linear_shunt_compensator_sections())
+        n.update_linear_shunt_compensator_sections(id='SHUNT', g_per_section=0.14, b_per_section=-0.01,
+                                                   max_section_count=4)
+        pd.testing.assert_frame_equal(_EXPECTED_LINEAR_SHUNT_SECTIONS_UPDATED,
+                                      n.get_linear_shunt_compensator_sections())
+        n.update_linear_shunt_compensator_sections(id='SHUNT', g_per_section=0.15, b_per_section=-0.02)
+        sections = n.get_linear_shunt_compensator_sections(id=['SHUNT'])
+        self.assertEqual(0.15, sections.loc['SHUNT']['g_per_section'])
+        self.assertEqual(-0.02, sections.loc['SHUNT']['b_per_section'])
 
-    def test_dangling_lines(self):
-        n = util.create_dangling_lines_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['DL']),
-                                columns=['name', 'r', 'x', 'g', 'b', 'p0', 'q0', 'p', 'q', 'i', 'voltage_level_id',
-                                         'bus_id',
-                                         'connected', 'ucte-x-node-code'],
-                                data=[['', 10.0, 1.0, 0.0001, 0.00001, 50.0, 30.0, NaN, NaN, NaN, 'VL', 'VL_0', True,
-                                       '']])
-
-        pd.testing.assert_frame_equal(expected, n.get_dangling_lines(), check_dtype=False)
-        n.update_dangling_lines(
-            pd.DataFrame(index=['DL'], columns=['r', 'x', 'g', 'b', 'p0', 'q0', 'connected'],
-                         data=[[11.0, 1.1, 0.0002, 0.00002, 40.0, 40.0, False]]))
-        updated = pd.DataFrame(index=pd.Series(name='id', data=['DL']),
-                               columns=['name', 'r', 'x', 'g', 'b', 'p0', 'q0', 'p', 'q', 'i', 'voltage_level_id',
-                                        'bus_id',
-                                        'connected', 'ucte-x-node-code'],
-                               data=[['', 11.0, 1.1, 0.0002, 0.00002, 40.0, 40.0, NaN, NaN, NaN, 'VL', '', False, '']])
-        pd.testing.assert_frame_equal(updated, n.get_dangling_lines(), check_dtype=False)
 
-    def test_batteries(self):
-        n = util.create_battery_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['BAT', 'BAT2']),
-                                columns=['name', 'max_p', 'min_p', 'p0', 'q0', 'p', 'q', 'i', 'voltage_level_id',
-                                         'bus_id',
-                                         'connected'],
-                                data=[['', 9999.99, -9999.99, 9999.99, 9999.99, -605, -225, NaN, 'VLBAT', 'VLBAT_0',
-                                       True],
-                                      ['', 200, -200, 100, 200, -605, -225, NaN, 'VLBAT', 'VLBAT_0', True]])
-        pd.testing.assert_frame_equal(expected, n.get_batteries(), check_dtype=False)
-        n.update_batteries(pd.DataFrame(index=['BAT2'], columns=['p0', 'q0'], data=[[50, 100]]))
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['BAT', 'BAT2']),
-                                columns=['name', 'max_p', 'min_p', 'p0', 'q0', 'p', 'q', 'i', 'voltage_level_id',
-                                         'bus_id',
-                                         'connected'],
-                                data=[['', 9999.99, -9999.99, 9999.99, 9999.99, -605, -225, NaN, 'VLBAT', 'VLBAT_0',
-                                       True],
-                                      ['', 200, -200, 50, 100, -605, -225, NaN, 'VLBAT', 'VLBAT_0', True]])
-        pd.testing.assert_frame_equal(expected, n.get_batteries(), check_dtype=False)
+class BusbarTestCase(unittest.TestCase):
+    """
+    Buses, busbar sections, voltage levels and substations.
+    """
 
-    def test_shunt(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['SHUNT']),
-                                columns=['name', 'g', 'b', 'model_type', 'max_section_count', 'section_count',
-                                         'voltage_regulation_on', 'target_v',
-                                         'target_deadband', 'regulating_bus_id', 'p', 'q', 'i',
-                                         'voltage_level_id', 'bus_id', 'connected'],
-                                data=[['', 0.0, -0.012, 'LINEAR', 1, 1, False, NaN, NaN,
-                                       'S1VL2_0', NaN, 1920, NaN, 'S1VL2', 'S1VL2_0', True]])
-        pd.testing.assert_frame_equal(expected, n.get_shunt_compensators(), check_dtype=False)
-        n.update_shunt_compensators(
-            pd.DataFrame(index=['SHUNT'],
-                         columns=['q', 'section_count', 'target_v', 'target_deadband',
-                                  'connected'],
-                         data=[[1900, 0, 50, 3, False]]))
-        n.update_shunt_compensators(
-            pd.DataFrame(index=['SHUNT'],
-                         columns=['voltage_regulation_on'],
-                         data=[[True]]))
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['SHUNT']),
-                                columns=['name', 'g', 'b', 'model_type', 'max_section_count', 'section_count',
-                                         'voltage_regulation_on', 'target_v',
-                                         'target_deadband', 'regulating_bus_id', 'p', 'q', 'i',
-                                         'voltage_level_id', 'bus_id', 'connected'],
-                                data=[['', 0.0, -0.0, 'LINEAR', 1, 0, True, 50, 3,
-                                       '', NaN, 1900, NaN, 'S1VL2', '', False]])
-        pd.testing.assert_frame_equal(expected, n.get_shunt_compensators(), check_dtype=False)
+    def test_buses(self):
+        n = pp.network.create_eurostag_tutorial_example1_network()
+        buses = n.get_buses()
+        pd.testing.assert_frame_equal(_EXPECTED_BUSES_INITIAL, buses)
 
-    def test_3_windings_transformers(self):
-        n = util.create_three_windings_transformer_network()
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['3WT']),
-                                columns=['name', 'rated_u0', 'r1', 'x1', 'g1', 'b1', 'rated_u1', 'rated_s1',
-                                         'ratio_tap_position1', 'phase_tap_position1', 'p1', 'q1', 'i1',
-                                         'voltage_level1_id', 'bus1_id', 'connected1', 'r2', 'x2', 'g2', 'b2',
-                                         'rated_u2', 'rated_s2', 'ratio_tap_position2', 'phase_tap_position2', 'p2',
-                                         'q2', 'i2', 'voltage_level2_id', 'bus2_id', 'connected2', 'r3', 'x3', 'g3',
-                                         'b3', 'rated_u3', 'rated_s3', 'ratio_tap_position3', 'phase_tap_position3',
-                                         'p3', 'q3', 'i3', 'voltage_level3_id', 'bus3_id', 'connected3'],
-                                data=[['', 132, 17.424, 1.7424, 0.00573921, 0.000573921, 132, NaN, -99999, -99999, NaN,
-                                       NaN,
-                                       NaN, 'VL_132', 'VL_132_0', True, 1.089, 0.1089, 0, 0, 33, NaN, 2, -99999, NaN,
-                                       NaN, NaN, 'VL_33', 'VL_33_0', True, 0.121, 0.0121, 0, 0, 11, NaN, 0, -99999, NaN,
-                                       NaN, NaN, 'VL_11', 'VL_11_0', True]])
-        pd.testing.assert_frame_equal(expected, n.get_3_windings_transformers(), check_dtype=False)
-        # test update
+        n.update_buses(pd.DataFrame(index=['VLGEN_0'], columns=['v_mag', 'v_angle'], data=[[400, 0]]))
+        buses = n.get_buses()
+        pd.testing.assert_frame_equal(_EXPECTED_BUSES_UPDATED, buses)
+
+    def test_voltage_levels_data_frame(self):
+        n = _network('eurostag')
+        voltage_levels = n.get_voltage_levels()
+        self.assertEqual(24.0, voltage_levels['nominal_v']['VLGEN'])
+
+    def test_substations_data_frame(self):
+        n = pp.network.create_eurostag_tutorial_example1_network()
+        pd.testing.assert_frame_equal(_EXPECTED_SUBSTATIONS_INITIAL, n.get_substations())
+        n.update_substations(id='P2', TSO='REE', country='ES')
+        pd.testing.assert_frame_equal(_EXPECTED_SUBSTATIONS_UPDATED, n.get_substations())
 
     def test_busbar_sections(self):
         n = pp.network.create_four_substations_node_breaker_network()
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['S1VL1_BBS', 'S1VL2_BBS1', 'S1VL2_BBS2', 'S2VL1_BBS', 'S3VL1_BBS',
-                                                      'S4VL1_BBS']),
-                                columns=['name', 'fictitious', 'v', 'angle', 'voltage_level_id', 'connected'],
-                                data=[['S1VL1_BBS', False, 224.6139, 2.2822, 'S1VL1', True],
-                                      ['S1VL2_BBS1', False, 400.0000, 0.0000, 'S1VL2', True],
-                                      ['S1VL2_BBS2', False, 400.0000, 0.0000, 'S1VL2', True],
-                                      ['S2VL1_BBS', False, 408.8470, 0.7347, 'S2VL1', True],
-                                      ['S3VL1_BBS', False, 400.0000, 0.0000, 'S3VL1', True],
-                                      ['S4VL1_BBS', False, 400.0000, -1.1259, 'S4VL1', True]])
-        pd.testing.assert_frame_equal(expected, n.get_busbar_sections(), check_dtype=False)
-
-        n.update_busbar_sections(
-            pd.DataFrame(index=['S1VL1_BBS'],
-                         columns=['fictitious'],
-                         data=[[True]]))
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['S1VL1_BBS', 'S1VL2_BBS1', 'S1VL2_BBS2', 'S2VL1_BBS', 'S3VL1_BBS',
-                                                      'S4VL1_BBS']),
-                                columns=['name', 'fictitious', 'v', 'angle', 'voltage_level_id', 'connected'],
-                                data=[['S1VL1_BBS', True, 224.6139, 2.2822, 'S1VL1', True],
-                                      ['S1VL2_BBS1', False, 400.0000, 0.0000, 'S1VL2', True],
-                                      ['S1VL2_BBS2', False, 400.0000, 0.0000, 'S1VL2', True],
-                                      ['S2VL1_BBS', False, 408.8470, 0.7347, 'S2VL1', True],
-                                      ['S3VL1_BBS', False, 400.0000, 0.0000, 'S3VL1', True],
-                                      ['S4VL1_BBS', False, 400.0000, -1.1259, 'S4VL1', True]])
-        pd.testing.assert_frame_equal(expected, n.get_busbar_sections(), check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_BUSBAR_SECTIONS_INITIAL, n.get_busbar_sections())
 
-    def test_non_linear_shunt(self):
-        n = util.create_non_linear_shunt_network()
-        expected = pd.DataFrame(index=pd.MultiIndex.from_tuples([('SHUNT', 0), ('SHUNT', 1)],
-                                                                names=['id', 'section']),
-                                columns=['g', 'b'],
-                                data=[[0.0, 0.00001],
-                                      [0.3, 0.02000]])
-        pd.testing.assert_frame_equal(expected, n.get_non_linear_shunt_compensator_sections(), check_dtype=False)
-        update = pd.DataFrame(index=pd.MultiIndex.from_tuples([('SHUNT', 0), ('SHUNT', 1)], names=['id', 'section']),
-                              columns=['g', 'b'],
-                              data=[[0.1, 0.00002],
-                                    [0.4, 0.03]])
-        n.update_non_linear_shunt_compensator_sections(update)
-        pd.testing.assert_frame_equal(update, n.get_non_linear_shunt_compensator_sections(), check_dtype=False)
+        n.update_busbar_sections(id='S1VL1_BBS', fictitious=True)
+        pd.testing.assert_frame_equal(_EXPECTED_BUSBAR_SECTIONS_UPDATED, n.get_busbar_sections(id=['S1VL1_BBS']))
 
     def test_voltage_levels(self):
         net = pp.network.create_eurostag_tutorial_example1_network()
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD']),
-                                columns=['name', 'substation_id', 'nominal_v', 'high_voltage_limit',
-                                         'low_voltage_limit'],
-                                data=[['', 'P1', 24, NaN, NaN],
-                                      ['', 'P1', 380, 500, 400],
-                                      ['', 'P2', 380, 500, 300],
-                                      ['', 'P2', 150, NaN, NaN]])
-        pd.testing.assert_frame_equal(expected, net.get_voltage_levels(), check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_VOLTAGE_LEVELS_INITIAL, net.get_voltage_levels())
         net.update_voltage_levels(id=['VLGEN', 'VLLOAD'], nominal_v=[25, 151], high_voltage_limit=[50, 175],
                                   low_voltage_limit=[20, 125])
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['VLGEN', 'VLHV1', 'VLHV2', 'VLLOAD']),
-                                columns=['name', 'substation_id', 'nominal_v', 'high_voltage_limit',
-                                         'low_voltage_limit'],
-                                data=[['', 'P1', 25, 50, 20],
-                                      ['', 'P1', 380, 500, 400],
-                                      ['', 'P2', 380, 500, 300],
-                                      ['', 'P2', 151, 175, 125]])
-        pd.testing.assert_frame_equal(expected, net.get_voltage_levels(), check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_VOLTAGE_LEVELS_UPDATED, net.get_voltage_levels())
 
-    def test_update_with_keywords(self):
-        n = util.create_non_linear_shunt_network()
-        n.update_non_linear_shunt_compensator_sections(id='SHUNT', section=0, g=0.2, b=0.000001)
-        self.assertEqual(0.2, n.get_non_linear_shunt_compensator_sections().loc['SHUNT', 0]['g'])
-        self.assertEqual(0.000001, n.get_non_linear_shunt_compensator_sections().loc['SHUNT', 0]['b'])
 
-    def test_update_generators_with_keywords(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        n.update_generators(id=['GTH1', 'GTH2'], target_p=[200, 300])
-        self.assertEqual([200, 300], n.get_generators().loc[['GTH1', 'GTH2'], 'target_p'].to_list())
+class TopologyTestCase(unittest.TestCase):
+    """
+    Switches, regulated terminals and node breaker / bus breaker views of voltage levels.
+    """
 
-    def test_invalid_update_kwargs(self):
+    def test_regulated_terminal_node_breaker(self):
         n = pp.network.create_four_substations_node_breaker_network()
+        gens = n.get_generators(attributes=['regulated_element_id'])
+        self.assertEqual('GH1', gens['regulated_element_id']['GH1'])
 
-        with self.assertRaises(RuntimeError) as context:
-            n.update_generators(df=pd.DataFrame(index=['GTH1'], columns=['target_p'], data=[300]),
-                                id='GTH1', target_p=300)
-        self.assertIn('only one form', str(context.exception))
+        n.update_generators(id='GH1', regulated_element_id='S1VL1_BBS')
+        updated_gens = n.get_generators(attributes=['regulated_element_id'])
+        self.assertEqual('S1VL1_BBS', updated_gens['regulated_element_id']['GH1'])
 
-        with self.assertRaises(ValueError) as context:
-            n.update_generators(id=['GTH1', 'GTH2'], target_p=100)
-        self.assertIn('same size', str(context.exception))
+        with self.assertRaises(pp.PyPowsyblError):
+            n.update_generators(id='GH1', regulated_element_id='LINE_S2S3')
 
-        with self.assertRaises(ValueError) as context:
-            n.update_generators(id=np.array(0, ndmin=3))
-        self.assertIn('dimensions', str(context.exception))
+    def test_regulated_terminal_bus_breaker(self):
+        n = pp.network.create_eurostag_tutorial_example1_network()
+        generators = n.get_generators(attributes=['regulated_element_id'])
+        self.assertEqual('', generators['regulated_element_id']['GEN'])
 
-    def test_create_network(self):
-        n = pp.network.create_ieee9()
-        self.assertEqual('ieee9cdf', n.id)
-        n = pp.network.create_ieee30()
-        self.assertEqual('ieee30cdf', n.id)
-        n = pp.network.create_ieee57()
-        self.assertEqual('ieee57cdf', n.id)
-        n = pp.network.create_ieee118()
-        self.assertEqual('ieee118cdf', n.id)
+        with self.assertRaises(pp.PyPowsyblError):
+            n.update_generators(id='GEN', regulated_element_id='NHV1')
+        with self.assertRaises(pp.PyPowsyblError):
+            n.update_generators(id='GEN', regulated_element_id='LOAD')
+
+    def test_update_switches_data_frame(self):
+        n = pp.network.load(str(TEST_DIR.joinpath('node-breaker.xiidm')))
+        switches = n.get_switches()
+        # no open switch
+        open_switches = switches.index[switches['open']].tolist()
+        self.assertEqual(0, len(open_switches))
+        # open 1 breaker
+        n.update_switches(pd.DataFrame(index=['BREAKER-BB2-VL1_VL2_1'], data={'open': [True]}))
+        switches = n.get_switches()
+        open_switches = switches.index[switches['open']].tolist()
+        self.assertEqual(['BREAKER-BB2-VL1_VL2_1'], open_switches)
 
     def test_node_breaker_view(self):
-        n = pp.network.create_four_substations_node_breaker_network()
+        n = _network('four_substations')
         topology = n.get_node_breaker_topology('S4VL1')
         switches = topology.switches
         nodes = topology.nodes
         self.assertEqual(6, len(switches))
-        self.assertEqual('S4VL1_BBS_LINES3S4_DISCONNECTOR', switches.loc['S4VL1_BBS_LINES3S4_DISCONNECTOR']['name'])
-        self.assertEqual('DISCONNECTOR', switches.loc['S4VL1_BBS_LINES3S4_DISCONNECTOR']['kind'])
-        self.assertEqual(False, switches.loc['S4VL1_BBS_LINES3S4_DISCONNECTOR']['open'])
-        self.assertEqual(0, switches.loc['S4VL1_BBS_LINES3S4_DISCONNECTOR']['node1'])
-        self.assertEqual(5, switches.loc['S4VL1_BBS_LINES3S4_DISCONNECTOR']['node2'])
+        disconnector = switches.loc[['S4VL1_BBS_LINES3S4_DISCONNECTOR'], ['name', 'kind', 'open', 'node1', 'node2']]
+        pd.testing.assert_frame_equal(_EXPECTED_S4VL1_LINES3S4_DISCONNECTOR, disconnector)
         self.assertEqual(7, len(nodes))
         self.assertTrue(topology.internal_connections.empty)
 
     def test_graph(self):
-        n = pp.network.create_four_substations_node_breaker_network()
+        n = _network('four_substations')
         network_topology = n.get_node_breaker_topology('S4VL1')
         graph = network_topology.create_graph()
         self.assertEqual(7, len(graph.nodes))
@@ -788,111 +1206,37 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
 
     @unittest.skip("plot graph skipping")
     def test_node_breaker_view_draw_graph(self):
+        import matplotlib.pyplot as plt
+        import networkx as nx
         n = pp.network.create_four_substations_node_breaker_network()
         network_topology = n.get_node_breaker_topology('S4VL1')
         graph = network_topology.create_graph()
         nx.draw_shell(graph, with_labels=True)
         plt.show()
 
-    def test_network_merge(self):
-        be = pp.network.create_micro_grid_be_network()
-        self.assertEqual(6, len(be.get_voltage_levels()))
-        nl = pp.network.create_micro_grid_nl_network()
-        self.assertEqual(4, len(nl.get_voltage_levels()))
-        be.merge(nl)
-        self.assertEqual(10, len(be.get_voltage_levels()))
-
-    def test_linear_shunt_compensator_sections(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['SHUNT']),
-                                columns=['g_per_section', 'b_per_section', 'max_section_count'],
-                                data=[[NaN, -0.012, 1]])
-        pd.testing.assert_frame_equal(expected, n.get_linear_shunt_compensator_sections(), check_dtype=False)
-        n.update_linear_shunt_compensator_sections(
-            pd.DataFrame(index=['SHUNT'],
-                         columns=['g_per_section', 'b_per_section', 'max_section_count'],
-                         data=[[0.14, -0.01, 4]]))
-        expected = pd.DataFrame(index=pd.Series(name='id',
-                                                data=['SHUNT']),
-                                columns=['g_per_section', 'b_per_section', 'max_section_count'],
-                                data=[[0.14, -0.01, 4]])
-        pd.testing.assert_frame_equal(expected, n.get_linear_shunt_compensator_sections(), check_dtype=False)
-        n.update_linear_shunt_compensator_sections(id='SHUNT', g_per_section=0.15, b_per_section=-0.02)
-        self.assertEqual(0.15, n.get_linear_shunt_compensator_sections().loc['SHUNT']['g_per_section'])
-        self.assertEqual(-0.02, n.get_linear_shunt_compensator_sections().loc['SHUNT']['b_per_section'])
-
     def test_bus_breaker_view(self):
-        n = pp.network.create_four_substations_node_breaker_network()
-        n.update_switches(pd.DataFrame(index=['S1VL2_COUPLER'], data={'open': [True]}))
-        topology = n.get_bus_breaker_topology('S1VL2')
+        with _scratch_variant(_network('four_substations')) as n:
+            n.update_switches(id='S1VL2_COUPLER', open=True)
+            topology = n.get_bus_breaker_topology('S1VL2')
         switches = topology.switches
         buses = topology.buses
         elements = topology.elements
-        expected_switches = pd.DataFrame(index=pd.Series(name='id',
-                                                         data=['S1VL2_TWT_BREAKER', 'S1VL2_VSC1_BREAKER',
-                                                               'S1VL2_GH1_BREAKER', 'S1VL2_GH2_BREAKER',
-                                                               'S1VL2_GH3_BREAKER', 'S1VL2_LD2_BREAKER',
-                                                               'S1VL2_LD3_BREAKER', 'S1VL2_LD4_BREAKER',
-                                                               'S1VL2_SHUNT_BREAKER', 'S1VL2_LCC1_BREAKER',
-                                                               'S1VL2_COUPLER']),
-                                         columns=['kind', 'open', 'bus1_id', 'bus2_id'],
-                                         data=[['BREAKER', False, 'S1VL2_0', 'S1VL2_3'],
-                                               ['BREAKER', False, 'S1VL2_1', 'S1VL2_5'],
-                                               ['BREAKER', False, 'S1VL2_0', 'S1VL2_7'],
-                                               ['BREAKER', False, 'S1VL2_0', 'S1VL2_9'],
-                                               ['BREAKER', False, 'S1VL2_0', 'S1VL2_11'],
-                                               ['BREAKER', False, 'S1VL2_1', 'S1VL2_13'],
-                                               ['BREAKER', False, 'S1VL2_1', 'S1VL2_15'],
-                                               ['BREAKER', False, 'S1VL2_1', 'S1VL2_17'],
-                                               ['BREAKER', False, 'S1VL2_0', 'S1VL2_19'],
-                                               ['BREAKER', False, 'S1VL2_1', 'S1VL2_21'],
-                                               ['BREAKER', True, 'S1VL2_0', 'S1VL2_1']])
-        expected_buses = pd.DataFrame(index=pd.Series(name='id',
-                                                      data=['S1VL2_0', 'S1VL2_1', 'S1VL2_3', 'S1VL2_5', 'S1VL2_7',
-                                                            'S1VL2_9', 'S1VL2_11', 'S1VL2_13', 'S1VL2_15', 'S1VL2_17',
-                                                            'S1VL2_19', 'S1VL2_21']),
-                                      columns=['name', 'bus_id'],
-                                      data=[['', 'S1VL2_0'], ['', 'S1VL2_1'], ['', 'S1VL2_0'], ['', 'S1VL2_1'],
-                                            ['', 'S1VL2_0'], ['', 'S1VL2_0'], ['', 'S1VL2_0'], ['', 'S1VL2_1'],
-                                            ['', 'S1VL2_1'], ['', 'S1VL2_1'], ['', 'S1VL2_0'], ['', 'S1VL2_1']])
-
-        expected_elements = pd.DataFrame.from_records(index='id', columns=['id', 'type', 'bus_id', 'side'],
-                                                      data=[
-                                                          ('S1VL2_BBS1', 'BUSBAR_SECTION', 'S1VL2_0', ''),
-                                                          ('S1VL2_BBS2', 'BUSBAR_SECTION', 'S1VL2_1', ''),
-                                                          ('TWT', 'TWO_WINDINGS_TRANSFORMER', 'S1VL2_3', 'TWO'),
-                                                          ('VSC1', 'HVDC_CONVERTER_STATION', 'S1VL2_5', ''),
-                                                          ('GH1', 'GENERATOR', 'S1VL2_7', ''),
-                                                          ('GH2', 'GENERATOR', 'S1VL2_9', ''),
-                                                          ('GH3', 'GENERATOR', 'S1VL2_11', ''),
-                                                          ('LD2', 'LOAD', 'S1VL2_13', ''),
-                                                          ('LD3', 'LOAD', 'S1VL2_15', ''),
-                                                          ('LD4', 'LOAD', 'S1VL2_17', ''),
-                                                          ('SHUNT', 'SHUNT_COMPENSATOR', 'S1VL2_19', ''),
-                                                          ('LCC1', 'HVDC_CONVERTER_STATION', 'S1VL2_21', ''),
-                                                      ])
-        pd.testing.assert_frame_equal(expected_switches, switches, check_dtype=False)
-        pd.testing.assert_frame_equal(expected_buses, buses, check_dtype=False)
-        pd.testing.assert_frame_equal(expected_elements, elements, check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_BUS_BREAKER_VIEW_SWITCHES, switches)
+        pd.testing.assert_frame_equal(_EXPECTED_BUS_BREAKER_VIEW_BUSES, buses)
+        pd.testing.assert_frame_equal(_EXPECTED_BUS_BREAKER_VIEW_ELEMENTS, elements)
 
     def test_not_connected_bus_breaker(self):
         n = pp.network.create_eurostag_tutorial_example1_network()
-        expected = pd.DataFrame.from_records(index='id', data=[{'id': 'NHV1', 'name': '', 'bus_id': 'VLHV1_0'}])
-        pd.testing.assert_frame_equal(expected, n.get_bus_breaker_topology('VLHV1').buses, check_dtype=False)
+        pd.testing.assert_frame_equal(_EXPECTED_VLHV1_BUS_BREAKER_BUSES, n.get_bus_breaker_topology('VLHV1').buses)
         n.update_lines(id=['NHV1_NHV2_1', 'NHV1_NHV2_2'], connected1=[False, False], connected2=[False, False])
         n.update_2_windings_transformers(id='NGEN_NHV1', connected1=False, connected2=False)
 
         topo = n.get_bus_breaker_topology('VLHV1')
-        bb_bus = topo.buses.loc['NHV1']
-        self.assertEqual('', bb_bus['name'])
-        self.assertEqual('', bb_bus['bus_id'])
-
-        line = topo.elements.loc['NHV1_NHV2_1']
-        self.assertEqual('', line['bus_id'])
+        pd.testing.assert_frame_equal(_EXPECTED_VLHV1_DISCONNECTED_BUSES, topo.buses.loc[['NHV1'], ['name', 'bus_id']])
+        pd.testing.assert_frame_equal(_EXPECTED_VLHV1_DISCONNECTED_LINE, topo.elements.loc[['NHV1_NHV2_1'], ['bus_id']])
 
     def test_graph_busbreakerview(self):
-        n = pp.network.create_four_substations_node_breaker_network()
+        n = _network('four_substations')
         network_topology = n.get_bus_breaker_topology('S4VL1')
         graph = network_topology.create_graph()
         self.assertEqual(4, len(graph.nodes))
@@ -900,203 +1244,59 @@ BBE1AA1               0 2 400.00 3000.00 0.00000 -1500.0 0.00000 0.00000 -9000.0
 
     @unittest.skip("plot graph skipping")
     def test_bus_breaker_view_draw_graph(self):
+        import matplotlib.pyplot as plt
+        import networkx as nx
         n = pp.network.create_four_substations_node_breaker_network()
         network_topology = n.get_bus_breaker_topology('S1VL2')
         graph = network_topology.create_graph()
         nx.draw_shell(graph, with_labels=True)
         plt.show()
 
+
+class MetadataTestCase(unittest.TestCase):
+    """
+    Dataframes metadata and attributes or elements filtering.
+    """
+
     def test_dataframe_attributes_filtering(self):
-        n = pp.network.create_eurostag_tutorial_example1_network()
-        buses_selected_attributes = n.get_buses(attributes=['v_mag', 'voltage_level_id'])
-        expected = pd.DataFrame(index=pd.Series(name='id', data=['VLGEN_0', 'VLHV1_0', 'VLHV2_0', 'VLLOAD_0']),
-                                columns=['v_mag', 'voltage_level_id'],
-                                data=[[NaN, 'VLGEN'],
-                                      [380, 'VLHV1'],
-                                      [380, 'VLHV2'],
-                                      [NaN, 'VLLOAD']])
-        pd.testing.assert_frame_equal(expected, buses_selected_attributes, check_dtype=False)
-        buses_default_attributes = n.get_buses(all_attributes=False)
-        expected_default_attributes = pd.DataFrame(
-            index=pd.Series(name='id', data=['VLGEN_0', 'VLHV1_0', 'VLHV2_0', 'VLLOAD_0']),
-            columns=['name', 'v_mag', 'v_angle', 'connected_component', 'synchronous_component',
-                     'voltage_level_id'],
-            data=[['', NaN, NaN, 0, 0, 'VLGEN'],
-                  ['', 380, NaN, 0, 0, 'VLHV1'],
-                  ['', 380, NaN, 0, 0, 'VLHV2'],
-                  ['', NaN, NaN, 0, 0, 'VLLOAD']])
-        pd.testing.assert_frame_equal(expected_default_attributes, buses_default_attributes, check_dtype=False)
-        buses_default_attributes2 = n.get_buses(attributes=[])
-        pd.testing.assert_frame_equal(expected_default_attributes, buses_default_attributes2, check_dtype=False)
-
-        buses_all_attributes = n.get_buses(all_attributes=True)
-        expected_all_attributes = expected_default_attributes
-        pd.testing.assert_frame_equal(expected_all_attributes, buses_all_attributes, check_dtype=False)
+        n = _network('eurostag')
+        # one fetch per filtering mode: selection, default (with and without an empty selection) and all
+        pd.testing.assert_frame_equal(_EXPECTED_BUSES_SELECTED_ATTRIBUTES,
+                                      n.get_buses(attributes=['v_mag', 'voltage_level_id']))
+        pd.testing.assert_frame_equal(_EXPECTED_BUSES_INITIAL, n.get_buses(all_attributes=False))
+        pd.testing.assert_frame_equal(_EXPECTED_BUSES_INITIAL, n.get_buses(attributes=[]))
+        pd.testing.assert_frame_equal(_EXPECTED_BUSES_INITIAL, n.get_buses(all_attributes=True))
 
-        try:
-            buses_all_attributes_conflicting_params = n.get_buses(all_attributes=True,
-                                                                  attributes=['v_mag', 'voltage_level_id'])
-            self.fail()
-        except RuntimeError as e:
-            self.assertEqual("parameters \"all_attributes\" and \"attributes\" are mutually exclusive", str(e))
+        with self.assertRaises(RuntimeError) as context:
+            n.get_buses(all_attributes=True, attributes=['v_mag', 'voltage_level_id'])
+        self.assertEqual('parameters "all_attributes" and "attributes" are mutually exclusive', str(context.exception))
 
     def test_metadata(self):
         meta_gen = pp._pypowsybl.get_network_elements_dataframe_metadata(pp._pypowsybl.ElementType.GENERATOR)
         meta_gen_index_default = [x for x in meta_gen if (x.is_index == True) and (x.is_default == True)]
-        print(meta_gen_index_default)
         self.assertTrue(len(meta_gen_index_default) > 0)
 
     def test_dataframe_elements_filtering(self):
-        network_four_subs = pp.network.create_four_substations_node_breaker_network()
-        network_micro_grid = pp.network.create_micro_grid_be_network()
-        network_eurostag = pp.network.create_eurostag_tutorial_example1_network()
-        network_non_linear_shunt = util.create_non_linear_shunt_network()
-        network_with_batteries = pp.network.load(str(TEST_DIR.joinpath('battery.xiidm')))
-
-        expected_selection = network_four_subs.get_2_windings_transformers().loc[['TWT']]
-        filtered_selection = network_four_subs.get_2_windings_transformers(id='TWT')
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_micro_grid.get_3_windings_transformers().loc[
-            ['_84ed55f4-61f5-4d9d-8755-bba7b877a246']]
-        filtered_selection = network_micro_grid.get_3_windings_transformers(
-            id=['_84ed55f4-61f5-4d9d-8755-bba7b877a246'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_micro_grid.get_shunt_compensators().loc[['_002b0a40-3957-46db-b84a-30420083558f']]
-        filtered_selection = network_micro_grid.get_shunt_compensators(id=['_002b0a40-3957-46db-b84a-30420083558f'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_with_batteries.get_batteries().loc[['BAT2']]
-        filtered_selection = network_with_batteries.get_batteries(id=['BAT2'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_busbar_sections().loc[['S1VL2_BBS2']]
-        filtered_selection = network_four_subs.get_busbar_sections(id=['S1VL2_BBS2'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_buses().loc[['S3VL1_0']]
-        filtered_selection = network_four_subs.get_buses(id=['S3VL1_0'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_eurostag.get_generators().loc[['GEN2', 'GEN']]
-        filtered_selection = network_eurostag.get_generators(id=['GEN2', 'GEN'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_hvdc_lines().loc[['HVDC2']]
-        filtered_selection = network_four_subs.get_hvdc_lines(id=['HVDC2'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_lcc_converter_stations().loc[['LCC2']]
-        filtered_selection = network_four_subs.get_lcc_converter_stations(id=['LCC2'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_linear_shunt_compensator_sections().loc[['SHUNT']]
-        filtered_selection = network_four_subs.get_linear_shunt_compensator_sections(id=['SHUNT'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_lines().loc[['LINE_S3S4']]
-        filtered_selection = network_four_subs.get_lines(id=['LINE_S3S4'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_loads().loc[['LD4']]
-        filtered_selection = network_four_subs.get_loads(id=['LD4'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_non_linear_shunt.get_non_linear_shunt_compensator_sections().loc[
-            pd.MultiIndex.from_tuples([('SHUNT', 1)], names=['id', 'section'])]
-        filtered_selection = network_non_linear_shunt.get_non_linear_shunt_compensator_sections(id=['SHUNT'],
-                                                                                                section=[1])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_phase_tap_changer_steps().loc[
-            pd.MultiIndex.from_tuples([('TWT', 6)], names=['id', 'position'])]
-        filtered_selection = network_four_subs.get_phase_tap_changer_steps(id=['TWT'], position=[6])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_phase_tap_changers().loc[['TWT']]
-        filtered_selection = network_four_subs.get_phase_tap_changers(id=['TWT'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_eurostag.get_ratio_tap_changer_steps().loc[
-            pd.MultiIndex.from_tuples([('NHV2_NLOAD', 0), ('NHV2_NLOAD', 2)],
-                                      names=['id', 'position'])]
-        filtered_selection = network_eurostag.get_ratio_tap_changer_steps(id=['NHV2_NLOAD', 'NHV2_NLOAD'],
-                                                                          position=[0, 2])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_eurostag.get_ratio_tap_changers().loc[['NHV2_NLOAD']]
-        filtered_selection = network_eurostag.get_ratio_tap_changers(id=['NHV2_NLOAD'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_static_var_compensators().loc[['SVC']]
-        filtered_selection = network_four_subs.get_static_var_compensators(id=['SVC'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_eurostag.get_substations().loc[['P2']]
-        filtered_selection = network_eurostag.get_substations(id=['P2'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_switches().loc[
-            ['S1VL2_GH1_BREAKER', 'S4VL1_BBS_SVC_DISCONNECTOR', 'S1VL2_COUPLER']]
-        filtered_selection = network_four_subs.get_switches(
-            id=['S1VL2_GH1_BREAKER', 'S4VL1_BBS_SVC_DISCONNECTOR', 'S1VL2_COUPLER'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_voltage_levels().loc[['S2VL1']]
-        filtered_selection = network_four_subs.get_voltage_levels(id=['S2VL1'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection = network_four_subs.get_vsc_converter_stations().loc[['VSC2']]
-        filtered_selection = network_four_subs.get_vsc_converter_stations(id=['VSC2'])
-        pd.testing.assert_frame_equal(expected_selection, filtered_selection, check_dtype=True)
-
-        expected_selection_empty = network_four_subs.get_generators().loc[pd.Index([], name='id')]
-        self.assertTrue(expected_selection_empty.empty)
-        filtered_selection_empty = network_four_subs.get_generators(id=[])
+        for network_name, getter, filters in _ELEMENTS_FILTERING_CASES:
+            with self.subTest(getter=getter):
+                network = _network(network_name)
+                full = getattr(network, getter)()
+                key = _ELEMENTS_FILTERING_KEYS.get(getter)
+                if key is None:
+                    expected_selection = full.reindex(np.atleast_1d(filters['id']))
+                else:
+                    locs = full.index.get_indexer(key)
+                    # get_indexer returns -1 for a missing key, which iloc would silently take as the last row
+                    self.assertTrue((locs >= 0).all())
+                    expected_selection = full.iloc[locs]
+                filtered_selection = getattr(network, getter)(**filters)
+                pd.testing.assert_frame_equal(expected_selection, filtered_selection)
+
+    def test_dataframe_empty_elements_filtering(self):
+        n = _network('four_substations')
+        filtered_selection_empty = n.get_generators(id=[])
         self.assertTrue(filtered_selection_empty.empty)
-
-    def test_limits(self):
-        network = util.create_dangling_lines_network()
-
-        expected = pd.DataFrame.from_records(
-            index='element_id',
-            columns=['element_id', 'element_type', 'side', 'name', 'type', 'value', 'acceptable_duration', 'is_fictitious'],
-            data=[('DL', 'DANGLING_LINE', 'NONE', 'permanent_limit', 'CURRENT', 100, -1, False),
-                  ('DL', 'DANGLING_LINE', 'NONE', '20\'', 'CURRENT', 120, 1200, False),
-                  ('DL', 'DANGLING_LINE', 'NONE', '10\'', 'CURRENT', 140, 600, False)]
-        )
-        pd.testing.assert_frame_equal(expected, network.get_operational_limits(), check_dtype=False)
-
-        network = pp.network.create_eurostag_tutorial_example1_with_power_limits_network()
-        expected = pd.DataFrame.from_records(
-            index='element_id',
-            columns=['element_id', 'element_type', 'side', 'name', 'type', 'value', 'acceptable_duration', 'is_fictitious'],
-            data=[('NHV1_NHV2_1', 'LINE', 'ONE', 'permanent_limit', 'ACTIVE_POWER', 500, -1, False),
-                  ('NHV1_NHV2_1', 'LINE', 'TWO', 'permanent_limit', 'ACTIVE_POWER', 1100, -1, False),
-                  ('NHV1_NHV2_1', 'LINE', 'ONE', 'permanent_limit', 'APPARENT_POWER', 500, -1, False),
-                  ('NHV1_NHV2_1', 'LINE', 'TWO', 'permanent_limit', 'APPARENT_POWER', 1100, -1, False)])
-        limits = network.get_operational_limits().loc['NHV1_NHV2_1']
-        limits = limits[limits['name'] == 'permanent_limit']
-        pd.testing.assert_frame_equal(expected, limits, check_dtype=False)
-        expected = pd.DataFrame.from_records(
-            index='element_id',
-            columns=['element_id', 'element_type', 'side', 'name', 'type', 'value', 'acceptable_duration', 'is_fictitious'],
-            data=[['NHV1_NHV2_2', 'LINE', 'ONE', "20'", 'ACTIVE_POWER', 1200, 1200, False],
-                  ['NHV1_NHV2_2', 'LINE', 'ONE', "20'", 'APPARENT_POWER', 1200, 1200, False]])
-        limits = network.get_operational_limits().loc['NHV1_NHV2_2']
-        limits = limits[limits['name'] == '20\'']
-        pd.testing.assert_frame_equal(expected, limits, check_dtype=False)
-        network = util.create_three_windings_transformer_with_current_limits_network()
-        expected = pd.DataFrame.from_records(
-            index='element_id',
-            columns=['element_id', 'element_type', 'side', 'name', 'type', 'value', 'acceptable_duration', 'is_fictitious'],
-            data=[['3WT', 'THREE_WINDINGS_TRANSFORMER', 'ONE', "10'", 'CURRENT', 1400, 600, False],
-                  ['3WT', 'THREE_WINDINGS_TRANSFORMER', 'TWO', "10'", 'CURRENT', 140, 600, False],
-                  ['3WT', 'THREE_WINDINGS_TRANSFORMER', 'THREE', "10'", 'CURRENT', 14, 600, False]])
-        limits = network.get_operational_limits().loc['3WT']
-        limits = limits[limits['name'] == '10\'']
-        pd.testing.assert_frame_equal(expected, limits, check_dtype=False)
+        self.assertEqual(list(n.get_generators(id=['GH1']).columns), list(filtered_selection_empty.columns))
 
 
 if __name__ == '__main__':